@@ -23,6 +23,9 @@ Arguments:
         --wanted: Number of nuclei to look for (default: 3)
         --no-gpu: Disable GPU acceleration for Cellpose
         --diameter: Expected diameter of cells in pixels (default: 15)
+        --frame-batch-size: Number of frames counted in one Cellpose call (default: 8)
+        --flow-threshold: Cellpose flow error threshold, 0 disables mask QC (default: 0.0)
+        --workers: Number of worker processes for views, useful on CPU-only machines (default: 1)
         --channels: Channel indices for Cellpose (default: "0,0")
         --model: Type of Cellpose model to use (default: "cyto3")
         --range: View range in format 'start:end' (e.g., '0:10')
@@ -32,9 +35,9 @@ Arguments:
 
 import argparse
 import sys
-import os
 from ..core.analyze import Analyzer
 import logging
+from pathlib import Path
 
 def parse_args():
     """Parse command line arguments.
@@ -87,6 +90,24 @@ def parse_args():
         default=15,
         help="Expected diameter of nuclei in pixels (default: 15)",
     )
+    parser.add_argument(
+        "--frame-batch-size",
+        type=int,
+        default=8,
+        help="Number of frames counted in one Cellpose call (default: 8)",
+    )
+    parser.add_argument(
+        "--flow-threshold",
+        type=float,
+        default=0.0,
+        help="Cellpose flow error threshold, 0 disables mask QC (default: 0.0)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for views, useful on CPU-only machines (default: 1)",
+    )
     parser.add_argument(
         "--no-gpu",
         action="store_true",
@@ -132,36 +153,47 @@ def main():
     logger = logging.getLogger("cell_filter.cli.analyze")
 
     # Check if patterns file exists
-    if not os.path.exists(args.patterns):
-        logger.error(f"Error: Patterns file not found: {args.patterns}")
+    patterns_path = Path(args.patterns)
+    if not patterns_path.is_file():
+        logger.error(f"Error: Patterns file not found: {patterns_path}")
         sys.exit(1)
 
     # Check if cells file exists
-    if not os.path.exists(args.cells):
-        logger.error(f"Error: Cells file not found: {args.cells}")
+    cells_path = Path(args.cells)
+    if not cells_path.is_file():
+        logger.error(f"Error: Cells file not found: {cells_path}")
         sys.exit(1)
 
+    # Parse view range before loading any data
+    if args.range is not None:
+        try:
+            start_view, end_view = map(int, args.range.split(":"))
+        except ValueError:
+            logger.error(f"Error: Invalid view range '{args.range}', expected 'start:end'")
+            sys.exit(1)
+
     try:
         # Initialize analyzer
         analyzer = Analyzer(
-            patterns_path=args.patterns,
-            cells_path=args.cells,
+            patterns_path=patterns_path,
+            cells_path=cells_path,
             output_folder=args.output,
             wanted=args.wanted,
             use_gpu=not args.no_gpu,
             diameter=args.diameter,
             nuclei_channel=args.nuclei_channel,
             cyto_channel=args.cyto_channel,
+            frame_batch_size=args.frame_batch_size,
+            flow_threshold=args.flow_threshold,
         )
 
         # Process views
         if args.all:
             logger.info("Processing all views")
-            analyzer.process_views(0, analyzer.generator.n_views)
+            analyzer.process_views(0, analyzer.generator.n_views, workers=args.workers)
         else:
             logger.info(f"Processing views {args.range}")
-            view_range = list(map(int, args.range.split(":")))
-            analyzer.process_views(view_range[0], view_range[1])
+            analyzer.process_views(start_view, end_view, workers=args.workers)
 
     except Exception as e:
         logger.error(f"Error during analysis: {e}")
@@ -23,12 +23,14 @@ Arguments:
     
     Optional:
         --min-frames: Minimum number of valid frames required for extraction (default: 20)
+        --frame-stride: Step between extracted frames, e.g. 2 keeps every other frame (default: 1)
+        --workers: Number of worker processes, one view each (default: 1)
+        --overwrite: Re-extract sequences whose outputs already exist
         --debug: Enable debug logging
 """
 
 import argparse
 import sys
-import os
 from ..core.extract import Extractor
 import logging
 from pathlib import Path
@@ -84,6 +86,23 @@ def parse_args():
         default=20,
         help="Minimum number of valid frames required for extraction (default: 20)",
     )
+    parser.add_argument(
+        "--frame-stride",
+        type=int,
+        default=1,
+        help="Step between extracted frames, e.g. 2 keeps every other frame (default: 1)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes, one view each (default: 1)",
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Re-extract sequences whose outputs already exist",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -114,18 +133,21 @@ def main():
     logger = logging.getLogger("cell_filter.cli.extract")
 
     # Check if patterns file exists
-    if not os.path.exists(args.patterns):
-        logger.error(f"Patterns file not found: {args.patterns}")
+    patterns_path = Path(args.patterns)
+    if not patterns_path.is_file():
+        logger.error(f"Patterns file not found: {patterns_path}")
         sys.exit(1)
 
     # Check if cells file exists
-    if not os.path.exists(args.cells):
-        logger.error(f"Cells file not found: {args.cells}")
+    cells_path = Path(args.cells)
+    if not cells_path.is_file():
+        logger.error(f"Cells file not found: {cells_path}")
         sys.exit(1)
 
     # Check if time series directory exists
-    if not os.path.exists(args.time_series):
-        logger.error(f"Time series directory not found: {args.time_series}")
+    time_series_dir = Path(args.time_series)
+    if not time_series_dir.is_dir():
+        logger.error(f"Time series directory not found: {time_series_dir}")
         sys.exit(1)
 
     # Create output directory if it doesn't exist
@@ -135,8 +157,8 @@ def main():
     try:
         # Initialize extractor
         extractor = Extractor(
-            patterns_path=args.patterns,
-            cells_path=args.cells,
+            patterns_path=patterns_path,
+            cells_path=cells_path,
             output_folder=args.output,
             nuclei_channel=args.nuclei_channel,
             cyto_channel=args.cyto_channel
@@ -145,8 +167,11 @@ def main():
         # Extract frames
         logger.info("Starting extraction process")
         extractor.extract(
-            time_series_dir=args.time_series,
-            min_frames=args.min_frames
+            time_series_dir=time_series_dir,
+            min_frames=args.min_frames,
+            frame_stride=args.frame_stride,
+            workers=args.workers,
+            overwrite=args.overwrite
         )
         logger.info("Extraction completed successfully")
 
@@ -35,9 +35,9 @@ Arguments:
 
 import argparse
 import sys
-import os
 from ..core.pattern import PatternDisplayer
 import logging
+from pathlib import Path
 
 def parse_args():
     """Parse command line arguments.
@@ -119,20 +119,22 @@ def main():
     logger = logging.getLogger("cell_filter.cli.info")
 
     # Check if patterns file exists
-    if not os.path.exists(args.patterns):
-        logger.error(f"Patterns file not found: {args.patterns}")
+    patterns_path = Path(args.patterns)
+    if not patterns_path.is_file():
+        logger.error(f"Patterns file not found: {patterns_path}")
         sys.exit(1)
 
     # Check if cells file exists
-    if not os.path.exists(args.cells):
-        logger.error(f"Cells file not found: {args.cells}")
+    cells_path = Path(args.cells)
+    if not cells_path.is_file():
+        logger.error(f"Cells file not found: {cells_path}")
         sys.exit(1)
 
     try:
         # Initialize info displayer
         displayer = PatternDisplayer(
-            patterns_path=args.patterns,
-            cells_path=args.cells,
+            patterns_path=patterns_path,
+            cells_path=cells_path,
             nuclei_channel=args.nuclei_channel,
             cyto_channel=args.cyto_channel
         )
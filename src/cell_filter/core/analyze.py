@@ -2,12 +2,21 @@
 Core analyzer functionality for cell-filter.
 """
 
-import json
+import multiprocessing
+import os
 import time
-from typing import Dict, List
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import compress
+from typing import BinaryIO, DefaultDict, Dict, List, Optional, Set, Union
+
+import cv2
+import numpy as np
+import orjson
 
 from .generate import CellGenerator, CellGeneratorParameters
 from .count import CellposeCounter
+from .time_series import encode_time_series
 import logging
 from pathlib import Path
 
@@ -23,10 +32,10 @@ class Patterns:
     and which frames have been saved for each pattern.
     
     Attributes:
-        tracked (List[int]): List of pattern indices currently being tracked
+        tracked (Set[int]): Set of pattern indices currently being tracked
         dropped_zero (List[int]): List of pattern indices dropped due to zero nuclei
         dropped_many (List[int]): List of pattern indices dropped due to too many nuclei
-        saved (Dict[int, List[int]]): Dictionary mapping pattern indices to saved frame indices
+        saved (DefaultDict[int, List[int]]): Mapping of pattern indices to saved frame indices (only patterns with saved frames)
     """
     
     def __init__(self, n_patterns: int) -> None:
@@ -36,10 +45,11 @@ class Patterns:
         Args:
             n_patterns (int): Total number of patterns to track
         """
-        self.tracked: List[int] = list(range(n_patterns))
+        self.tracked: Set[int] = set(range(n_patterns))
         self.dropped_zero: List[int] = []
         self.dropped_many: List[int] = []
-        self.saved: Dict[int, List[int]] = {i: [] for i in range(n_patterns)}
+        self.saved: DefaultDict[int, List[int]] = defaultdict(list)
+        self._tracked_array: Optional[np.ndarray] = None
     
     def drop_zero(self, idx: int) -> None:
         """
@@ -49,9 +59,10 @@ class Patterns:
             idx (int): Index of the pattern to drop
         """
         if idx in self.tracked:
-            self.tracked.remove(idx)
+            self.tracked.discard(idx)
+            self._tracked_array = None
             self.dropped_zero.append(idx)
-            logger.debug(f"Dropped pattern {idx} due to zero nuclei")
+            logger.debug("Dropped pattern %d due to zero nuclei", idx)
     
     def drop_many(self, idx: int) -> None:
         """
@@ -61,9 +72,10 @@ class Patterns:
             idx (int): Index of the pattern to drop
         """
         if idx in self.tracked:
-            self.tracked.remove(idx)
+            self.tracked.discard(idx)
+            self._tracked_array = None
             self.dropped_many.append(idx)
-            logger.debug(f"Dropped pattern {idx} due to too many nuclei")
+            logger.debug("Dropped pattern %d due to too many nuclei", idx)
     
     def save_frame(self, idx: int, frame_idx: int) -> None:
         """
@@ -74,7 +86,7 @@ class Patterns:
             frame_idx (int): Index of the frame to save
         """
         self.saved[idx].append(frame_idx)
-        logger.debug(f"Saved frame {frame_idx} for pattern {idx}")
+        logger.debug("Saved frame %d for pattern %d", frame_idx, idx)
     
     def get_tracked_indices(self) -> List[int]:
         """
@@ -82,9 +94,25 @@ class Patterns:
         Should return immutable
         
         Returns:
-            List[int]: Copy of the list of tracked indices
+            List[int]: Sorted copy of the tracked indices
+        """
+        return sorted(self.tracked)
+    
+    def tracked_array(self) -> np.ndarray:
+        """
+        Get the tracked indices as a sorted, read-only array.
+        
+        The array is cached and only rebuilt after a pattern has been dropped.
+        
+        Returns:
+            np.ndarray: Sorted int64 array of tracked indices
         """
-        return list(self.tracked)
+        if self._tracked_array is None:
+            tracked_array = np.fromiter(self.tracked, dtype=np.int64, count=len(self.tracked))
+            tracked_array.sort()
+            tracked_array.flags.writeable = False
+            self._tracked_array = tracked_array
+        return self._tracked_array
     
     def get_valid_patterns(self) -> Dict[int, List[int]]:
         """
@@ -94,7 +122,7 @@ class Patterns:
         Returns:
             Dict[int, List[int]]: Dictionary mapping pattern indices to a copy of their valid frame indices
         """
-        return {idx: list(frames) for idx, frames in self.saved.items() if frames}
+        return {idx: list(self.saved[idx]) for idx in sorted(self.saved)}
 
 class Analyzer:
     """
@@ -105,46 +133,66 @@ class Analyzer:
     
     Attributes:
         generator (CellGenerator): Cell generator instance
-        counter (CellposeCounter): Cell counter instance
+        counter (Optional[CellposeCounter]): Cell counter instance, created on first use
         wanted (int): Desired number of nuclei per pattern
+        frame_batch_size (int): Number of frames counted per Cellpose call
+        use_gpu (bool): Whether the Cellpose model runs on the GPU
+        flow_threshold (float): Cellpose flow error threshold (0 disables mask QC)
+        output_path (Path): Resolved folder for analysis results
         patterns (Patterns): Pattern tracking state
     """
 
+    # Append-only file listing processed view indices, one per line
+    TRACKING_FILE = "processed_views.jsonl"
+
     # =====================================================================
     # Constructor and Initialization
     # =====================================================================
 
     def __init__(
         self,
-        patterns_path: str,
-        cells_path: str,
+        patterns_path: Union[str, Path],
+        cells_path: Union[str, Path],
         output_folder: str,
         wanted: int,
         use_gpu: bool,
         diameter: int,
         nuclei_channel: int,
-        cyto_channel: int
+        cyto_channel: int,
+        frame_batch_size: int = 8,
+        flow_threshold: float = 0.0
     ) -> None:
         """
         Initialize the Analyzer with configuration parameters.
         
         Args:
-            patterns_path (str): Path to the patterns ND2 file
-            cells_path (str): Path to the cell ND2 file
+            patterns_path (Union[str, Path]): Path to the patterns ND2 file
+            cells_path (Union[str, Path]): Path to the cell ND2 file
             output_folder (str): Path to save analysis results
             wanted (int): Desired number of nuclei per pattern
             use_gpu (bool): Whether to use GPU for cell counting
             diameter (int): Expected diameter of nuclei
+            frame_batch_size (int): Number of frames whose nuclei are counted in one Cellpose call
+            flow_threshold (float): Cellpose flow error threshold (0 disables mask QC)
             
         Raises:
             ValueError: If initialization fails
         """
-        self.output_folder = str(Path(output_folder).resolve())
+        if frame_batch_size < 1:
+            raise ValueError(f"frame_batch_size must be at least 1, got {frame_batch_size}")
+        self.patterns_path = str(patterns_path)
+        self.cells_path = str(cells_path)
+        self.output_path = Path(output_folder).resolve()
+        self.output_folder = str(self.output_path)
         self.diameter = diameter
+        self.frame_batch_size = frame_batch_size
+        self.wanted = wanted
+        self.use_gpu = use_gpu
+        self.flow_threshold = flow_threshold
+        self.counter: Optional[CellposeCounter] = None
 
         try:
             self._init_generator(patterns_path, cells_path, nuclei_channel, cyto_channel)
-            self._init_counter(wanted, use_gpu)
             logger.debug(f"Successfully initialized Analyzer with patterns: {patterns_path} and cells: {cells_path}")
         except Exception as e:
             logger.error(f"Error initializing Analyzer: {e}")
@@ -175,23 +223,30 @@ class Analyzer:
             logger.error(f"Error initializing generator: {e}")
             raise
     
-    def _init_counter(self, wanted: int, use_gpu: bool) -> None:
+    def _init_counter(self, use_gpu: bool, flow_threshold: float) -> None:
         """
         Initialize the cell counter.
         
         Args:
-            wanted (int): Desired number of nuclei per pattern
             use_gpu (bool): Whether to use GPU for cell counting
+            flow_threshold (float): Cellpose flow error threshold (0 disables mask QC)
+            
+        Note:
+            The counter is created once per Analyzer so the model weights stay
+            resident on the device across all processed views. It is only created
+            when views are analyzed in this process (see _get_counter), so a main
+            process that hands views to workers never loads a model of its own.
             
         Raises:
             ValueError: If initialization fails
         """
         try:
             self.counter = CellposeCounter(
-                use_gpu=use_gpu
+                use_gpu=use_gpu,
+                flow_threshold=flow_threshold,
+                interp=True
             )
-            self.wanted = wanted
-            logger.debug(f"Initialized counter with wanted={wanted}")
+            logger.debug(f"Initialized counter with wanted={self.wanted}")
         except Exception as e:
             logger.error(f"Error initializing counter: {e}")
             raise
@@ -200,73 +255,263 @@ class Analyzer:
     # Private Methods
     # =====================================================================
 
-    def _process_frame(self, frame_idx: int) -> None:
+    def _get_counter(self) -> CellposeCounter:
         """
-        Process a single frame and update pattern tracking.
+        Get the cell counter, loading the Cellpose model on first use.
+        
+        Returns:
+            CellposeCounter: Cell counter of this Analyzer
+        """
+        if self.counter is None:
+            self._init_counter(self.use_gpu, self.flow_threshold)
+        return self.counter
+
+    def _worker_kwargs(self) -> Dict:
+        """
+        Get the keyword arguments that rebuild this Analyzer in a worker process.
+        
+        Returns:
+            Dict: Keyword arguments for the Analyzer constructor
+        """
+        return dict(
+            patterns_path=self.patterns_path,
+            cells_path=self.cells_path,
+            output_folder=self.output_folder,
+            wanted=self.wanted,
+            use_gpu=self.use_gpu,
+            diameter=self.diameter,
+            nuclei_channel=self.generator.parameters.nuclei_channel,
+            cyto_channel=self.generator.parameters.cyto_channel,
+            frame_batch_size=self.frame_batch_size,
+            flow_threshold=self.flow_threshold
+        )
+
+    def _update_patterns(self, frame_idx: int, pattern_indices: np.ndarray, counts: List[int]) -> None:
+        """
+        Update pattern tracking for a single frame based on nuclei counts.
+        
+        Patterns that were dropped earlier in the same batch are skipped.
+        
+        Args:
+            frame_idx (int): Index of the frame the counts belong to
+            pattern_indices (np.ndarray): Pattern indices the counts belong to
+            counts (List[int]): Nuclei count for each pattern
+        """
+        # Classify all patterns of this frame at once, skipping already dropped ones
+        indices = np.asarray(pattern_indices, dtype=np.int64)
+        counts = np.asarray(counts, dtype=np.int64)
+        is_tracked = np.isin(indices, self.patterns.tracked_array())
+        is_wanted = counts == self.wanted
+        saved_patterns = indices[is_tracked & is_wanted].tolist()
+        dropped_many = indices[is_tracked & (counts > self.wanted)].tolist()
+        dropped_zero = indices[is_tracked & (counts == 0) & ~is_wanted].tolist()
+        
+        # Update pattern tracking based on counts
+        for pattern_idx in saved_patterns:
+            self.patterns.save_frame(pattern_idx, frame_idx)
+        for pattern_idx in dropped_many:
+            self.patterns.drop_many(pattern_idx)
+        for pattern_idx in dropped_zero:
+            self.patterns.drop_zero(pattern_idx)
+        
+        # Log detailed results for this frame
+        if saved_patterns:
+            logger.debug("Frame %d: Patterns with %d nuclei: %s", frame_idx, self.wanted, saved_patterns)
+        if dropped_many:
+            logger.debug("Frame %d: Dropped patterns (too many nuclei): %s", frame_idx, dropped_many)
+        if dropped_zero:
+            logger.debug("Frame %d: Dropped patterns (no nuclei): %s", frame_idx, dropped_zero)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Frame %d: Remaining tracked patterns: %s", frame_idx, self.patterns.get_tracked_indices())
+
+    def _read_crops(self, frame_indices: List[int], pattern_indices: np.ndarray) -> List[List[np.ndarray]]:
+        """
+        Read the normalized nuclei crops of a batch of frames from the current view.
+        
+        Only the regions of the given patterns are kept, so the full frames are
+        released right after decoding. Reading stops early once all patterns
+        have been dropped.
         
         Args:
-            frame_idx (int): Index of the frame to process
+            frame_indices (List[int]): Indices of the frames to read
+            pattern_indices (np.ndarray): Indices of the patterns to crop
+            
+        Returns:
+            List[List[np.ndarray]]: Crops per frame, in the order of frame_indices
+        """
+        frame_crops = []
+        for frame_idx in frame_indices:
+            if not self.patterns.tracked:
+                break
+            frame_crops.append(self.generator.read_nuclei_crops(frame_idx, pattern_indices, normalize=True))
+        return frame_crops
+
+    def _process_frames(
+        self,
+        frame_indices: List[int],
+        pattern_indices: np.ndarray,
+        frame_crops: List[List[np.ndarray]]
+    ) -> None:
+        """
+        Process a batch of frames with a single Cellpose call and update pattern tracking.
+        
+        Nuclei crops of all tracked patterns are gathered across the whole batch so the
+        counter is invoked once per batch instead of once per frame. Counts are then
+        applied frame by frame in chronological order.
+        
+        Args:
+            frame_indices (List[int]): Indices of the frames to process
+            pattern_indices (np.ndarray): Indices of the patterns the crops were read for
+            frame_crops (List[List[np.ndarray]]): Nuclei crops per frame matching frame_indices
             
         Raises:
             ValueError: If processing fails
         """
         try:
-            # Load current frame
-            self.generator.load_nuclei(frame_idx)
+            # Skip patterns dropped after the crops were read
+            keep = np.isin(pattern_indices, self.patterns.tracked_array())
+            tracked_indices = pattern_indices[keep]
             
-            # Collect all nuclei for this frame
+            # Collect all nuclei for this batch of frames
             nuclei_list = []
-            tracked_indices = self.patterns.get_tracked_indices()
-            for pattern_idx in tracked_indices:
-                try:
-                    nuclei = self.generator.extract_nuclei(pattern_idx, normalize=True)
-                    nuclei_list.append(nuclei)
-                except Exception as e:
-                    logger.warning(f"Error extracting nuclei for frame {frame_idx}, pattern {pattern_idx}: {e}")
-                    self.patterns.tracked.remove(pattern_idx)
-                    continue
+            batch = []
+            for frame_idx, crops in zip(frame_indices, frame_crops):
+                nuclei_list.extend(compress(crops, keep))
+                batch.append((frame_idx, tracked_indices))
             
             if not nuclei_list:
-                logger.warning(f"No valid nuclei regions found in frame {frame_idx}")
+                logger.warning("No valid nuclei regions found in frames %d-%d", frame_indices[0], frame_indices[-1])
                 return
             
-            # Count nuclei for all patterns in this frame
+            # Count nuclei for all patterns in all frames of the batch
+            counter = self._get_counter()
             try:
-                counts = self.counter.count_nuclei(nuclei_list, self.diameter)
+                counts = counter.count_nuclei(nuclei_list, self.diameter)
             except Exception as e:
-                logger.error(f"Error counting nuclei in frame {frame_idx}: {e}")
+                logger.error(f"Error counting nuclei in frames {frame_indices[0]}-{frame_indices[-1]}: {e}")
                 return
             
-            # Track changes for this frame
-            saved_patterns = []
-            dropped_many = []
-            dropped_zero = []
+            # Scatter counts back to their frames
+            offset = 0
+            for frame_idx, frame_patterns in batch:
+                frame_counts = counts[offset:offset + len(frame_patterns)]
+                offset += len(frame_patterns)
+                self._update_patterns(frame_idx, frame_patterns, frame_counts)
             
-            # Update pattern tracking based on counts
-            for pattern_idx, n_count in zip(tracked_indices, counts):
-                if n_count == self.wanted:
-                    self.patterns.save_frame(pattern_idx, frame_idx)
-                    saved_patterns.append(pattern_idx)
-                    logger.debug(f"Pattern {pattern_idx} has {self.wanted} nuclei in frame {frame_idx}")
-                elif n_count > self.wanted:
-                    self.patterns.drop_many(pattern_idx)
-                    dropped_many.append(pattern_idx)
-                elif n_count == 0:
-                    self.patterns.drop_zero(pattern_idx)
-                    dropped_zero.append(pattern_idx)
+        except Exception as e:
+            logger.error(f"Error processing frames {frame_indices[0]}-{frame_indices[-1]}: {e}")
+            raise ValueError(f"Error processing frames {frame_indices[0]}-{frame_indices[-1]}: {e}")
+
+    def _load_processed_views(self) -> Set[int]:
+        """
+        Load the indices of views processed in previous runs.
+        
+        Returns:
+            Set[int]: Indices of already processed views
+        """
+        tracking_file = self.output_path / self.TRACKING_FILE
+        legacy_tracking_file = self.output_path / "processed_views.json"
+        
+        processed_views = set()
+        try:
+            if legacy_tracking_file.exists():
+                processed_views.update(orjson.loads(legacy_tracking_file.read_bytes()))
+            if tracking_file.exists():
+                with open(tracking_file, 'rb') as f:
+                    processed_views.update(orjson.loads(line) for line in f if line.strip())
+            logger.debug(f"Found {len(processed_views)} previously processed views")
+        except Exception as e:
+            logger.warning(f"Error reading tracking file: {e}")
+        return processed_views
+
+    def _save_view_results(self, tracking: BinaryIO, view_idx: int, results: Dict) -> None:
+        """
+        Save the results of a view and mark it as processed.
+        
+        Results are written to a temporary file and renamed into place, so an
+        interrupted run never leaves a truncated results file behind. The view is
+        only marked as processed once its results are complete.
+        
+        Args:
+            tracking (BinaryIO): Open append handle of the tracking file
+            view_idx (int): Index of the processed view
+            results (Dict): Analysis results of the view
+        """
+        view_output_path = self.output_path / f"time_series_{view_idx:03d}.json"
+        tmp_output_path = view_output_path.with_suffix(".json.tmp")
+        with open(tmp_output_path, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        os.replace(tmp_output_path, view_output_path)
+        
+        tracking.write(orjson.dumps(view_idx) + b"\n")
+        tracking.flush()
             
-            # Log detailed results for this frame
-            if saved_patterns:
-                logger.debug(f"Frame {frame_idx}: Patterns with {self.wanted} nuclei: {saved_patterns}")
-            if dropped_many:
-                logger.debug(f"Frame {frame_idx}: Dropped patterns (too many nuclei): {dropped_many}")
-            if dropped_zero:
-                logger.debug(f"Frame {frame_idx}: Dropped patterns (no nuclei): {dropped_zero}")
-            logger.debug(f"Frame {frame_idx}: Remaining tracked patterns: {self.patterns.get_tracked_indices()}")
+        logger.info(f"Saved results for view {view_idx} to {view_output_path}")
+
+    def _process_views_sequential(self, view_indices: List[int], tracking: BinaryIO) -> None:
+        """
+        Process views one after another in this process.
+        
+        Args:
+            view_indices (List[int]): Indices of the views to process
+            tracking (BinaryIO): Open append handle of the tracking file
+        """
+        logger.debug(f"Starting sequential processing for views {view_indices}")
+        
+        # The Cellpose model is loaded once here and shared by all views
+        model = self._get_counter().model
+        logger.debug(f"Using Cellpose model {id(model)} on {model.device} for all views")
+        
+        for view_idx in view_indices:
+            try:
+                # Process the view
+                time_start = time.time()
+                results = self.analyze_time_series(view_idx)
+                time_end = time.time()
+                logger.info(f"Time taken to process view {view_idx}: {time_end - time_start} seconds")
+                
+                # Save results immediately
+                self._save_view_results(tracking, view_idx, results)
+            except Exception as e:
+                logger.error(f"Error processing view {view_idx}: {e}")
+                # Continue with next view even if this one fails
             
-        except Exception as e:
-            logger.error(f"Error processing frame {frame_idx}: {e}")
-            raise ValueError(f"Error processing frame {frame_idx}: {e}")
+            # Checked outside the try: a re-created model is a bug, not a failure of this view
+            if self.counter.model is not model:
+                raise RuntimeError("Cellpose model was re-created during view processing")
+
+    def _process_views_parallel(self, view_indices: List[int], tracking: BinaryIO, workers: int) -> None:
+        """
+        Process views in a pool of worker processes.
+        
+        Args:
+            view_indices (List[int]): Indices of the views to process
+            tracking (BinaryIO): Open append handle of the tracking file
+            workers (int): Number of worker processes
+        """
+        logger.debug(f"Starting parallel processing for views {view_indices} with {workers} workers")
+        if self.use_gpu:
+            logger.warning(f"Each of the {workers} workers loads its own Cellpose model on the GPU; "
+                           f"on a single GPU workers=1 with frame batching is usually faster")
+        
+        # Spawn so that workers don't inherit torch/CUDA state from this process;
+        # they start without logging configuration, so pass on the package log level
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self._worker_kwargs(), logging.getLogger("cell_filter").getEffectiveLevel())
+        ) as executor:
+            futures = {executor.submit(_analyze_view, view_idx): view_idx for view_idx in view_indices}
+            for future in as_completed(futures):
+                view_idx = futures[future]
+                try:
+                    results = future.result()
+                    self._save_view_results(tracking, view_idx, results)
+                except Exception as e:
+                    logger.error(f"Error processing view {view_idx}: {e}")
+                    # Continue with next view even if this one fails
+                    continue
 
     # =====================================================================
     # Public Methods
@@ -280,7 +525,7 @@ class Analyzer:
             view_idx (int): Index of the view to analyze
             
         Returns:
-            Dict: Dictionary containing analysis results
+            Dict: Versioned analysis results with run-length encoded frames per pattern
             
         Raises:
             ValueError: If analysis fails
@@ -294,19 +539,35 @@ class Analyzer:
             self.generator.process_patterns()
             self.patterns = Patterns(self.generator.n_patterns)
             
-            # Process each frame
-            for frame_idx in range(self.generator.n_frames):
-                logger.info(f"Processing frame {frame_idx}/{self.generator.n_frames}")
-                self._process_frame(frame_idx)
+            # Process frames in batches, reading the next batch while the current one is counted
+            n_frames = self.generator.n_frames
+            batches = [
+                list(range(batch_start, min(batch_start + self.frame_batch_size, n_frames)))
+                for batch_start in range(0, n_frames, self.frame_batch_size)
+            ]
+            with ThreadPoolExecutor(max_workers=1) as prefetcher:
+                pattern_indices = self.patterns.tracked_array()
+                pending = prefetcher.submit(self._read_crops, batches[0], pattern_indices) if batches else None
+                for batch_idx, frame_indices in enumerate(batches):
+                    read_indices = pattern_indices
+                    frame_crops = pending.result()
+                    # Stop early once every pattern has been dropped
+                    if not self.patterns.tracked:
+                        logger.info("No tracked patterns left, skipping frames %d-%d", frame_indices[0], n_frames - 1)
+                        break
+                    if batch_idx + 1 < len(batches):
+                        pattern_indices = self.patterns.tracked_array()
+                        pending = prefetcher.submit(self._read_crops, batches[batch_idx + 1], pattern_indices)
+                    logger.info("Processing frames %d-%d/%d", frame_indices[0], frame_indices[-1], n_frames)
+                    self._process_frames(frame_indices, read_indices, frame_crops)
             
             # Build results
-            results = {
-                "time_series": self.patterns.get_valid_patterns()
-            }
+            time_series = self.patterns.get_valid_patterns()
+            results = encode_time_series(time_series)
             
             # Log final summary
             logger.debug(f"\nAnalysis complete:")
-            logger.debug(f"  Final valid patterns: {list(results['time_series'].keys())}")
+            logger.debug(f"  Final valid patterns: {list(time_series.keys())}")
             
             # Log final dropped patterns summary
             logger.debug("\nFinal dropped patterns summary:")
@@ -321,68 +582,84 @@ class Analyzer:
             logger.error(f"Error in time series analysis: {e}")
             raise ValueError(f"Error in time series analysis: {e}")
 
-    def process_views(self, start_view: int, end_view: int) -> None:
+    def process_views(self, start_view: int, end_view: int, workers: int = 1) -> None:
         """
-        Process a range of views sequentially.
+        Process a range of views, sequentially or with a pool of worker processes.
+        
+        With workers > 1, whole views are farmed out to worker processes that each
+        build their own Analyzer (and Cellpose model). Results are written by the
+        main process only. Use this for CPU builds, where mask post-processing
+        dominates; on a single GPU keep workers=1 and rely on frame batching.
         
         Args:
-            view_range (List[int]): List of view indices to process
+            start_view (int): Starting view index (inclusive)
             end_view (int): Ending view index (exclusive)
+            workers (int): Number of worker processes (1 processes views in this process)
             
         Raises:
-            ValueError: If view range is invalid
+            ValueError: If view range or number of workers is invalid
         """
         if start_view < 0 or end_view > self.generator.n_views or start_view >= end_view:
             raise ValueError(f"Invalid view range: {start_view} to {end_view} (total views: {self.generator.n_views})")
+        if workers < 1:
+            raise ValueError(f"Number of workers must be at least 1, got {workers}")
             
         # Create output folder if it doesn't exist
-        output_path = Path(self.output_folder)
-        output_path.mkdir(parents=True, exist_ok=True)
-        
-        # Path for tracking file
-        tracking_file = output_path / "processed_views.json"
-        
-        # Load previously processed views if tracking file exists
-        processed_views = set()
-        if tracking_file.exists():
-            try:
-                with open(tracking_file, 'r') as f:
-                    processed_views = set(json.load(f))
-                logger.debug(f"Found {len(processed_views)} previously processed views")
-            except Exception as e:
-                logger.warning(f"Error reading tracking file: {e}")
-        
-        logger.debug(f"Starting sequential processing for views {start_view} to {end_view}")
+        self.output_path.mkdir(parents=True, exist_ok=True)
         
+        # Skip views that were already processed
+        processed_views = self._load_processed_views()
+        view_indices = []
         for view_idx in range(start_view, end_view):
-            # Skip if already processed
             if view_idx in processed_views:
                 logger.info(f"Skipping already processed view {view_idx}")
-                continue
-                
-            try:
-                # Process the view
-                time_start = time.time()
-                results = self.analyze_time_series(view_idx)
-                time_end = time.time()
-                logger.info(f"Time taken to process view {view_idx}: {time_end - time_start} seconds")
-                
-                # Save results immediately
-                view_output_path = output_path / f"time_series_{view_idx:03d}.json"
-                with open(view_output_path, 'w') as f:
-                    json.dump(results, f, indent=2)
-                
-                # Update tracking file
-                processed_views.add(view_idx)
-                with open(tracking_file, 'w') as f:
-                    json.dump(sorted(list(processed_views)), f, indent=2)
-                    
-                logger.info(f"Saved results for view {view_idx} to {view_output_path}")
-            except Exception as e:
-                logger.error(f"Error processing view {view_idx}: {e}")
-                # Continue with next view even if this one fails
-                continue
+            else:
+                view_indices.append(view_idx)
+        
+        # Keep one append handle to the tracking file for the whole run
+        with open(self.output_path / self.TRACKING_FILE, 'ab') as tracking:
+            if workers > 1:
+                self._process_views_parallel(view_indices, tracking, workers)
+            else:
+                self._process_views_sequential(view_indices, tracking)
                 
-        logger.debug(f"Sequential processing complete for views {start_view} to {end_view}")
+        logger.debug(f"Processing complete for views {start_view} to {end_view}")
         self.generator.close_files()
+
+
+# =====================================================================
+# Worker Processes
+# =====================================================================
+
+_worker_analyzer: Optional[Analyzer] = None
+
+def _init_worker(analyzer_kwargs: Dict, log_level: int) -> None:
+    """
+    Build one Analyzer, and with it one Cellpose model, per worker process.
+    
+    Args:
+        analyzer_kwargs (Dict): Keyword arguments for the Analyzer constructor
+        log_level (int): Log level of the cell_filter logger in the main process
+    """
+    # Spawned workers don't inherit the logging setup of the CLI, so mirror it here
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+    logging.getLogger("cell_filter").setLevel(log_level)
+    # Views already run in parallel, so OpenCV's own thread pool would only oversubscribe the cores
+    cv2.setNumThreads(1)
+    global _worker_analyzer
+    _worker_analyzer = Analyzer(**analyzer_kwargs)
+    _worker_analyzer._get_counter()
+
+def _analyze_view(view_idx: int) -> Dict:
+    """
+    Analyze a single view in a worker process.
+    
+    Args:
+        view_idx (int): Index of the view to analyze
         
+    Returns:
+        Dict: Analysis results of the view
+    """
+    if _worker_analyzer is None:
+        raise RuntimeError("Worker analyzer not initialized")
+    return _worker_analyzer.analyze_time_series(view_idx)
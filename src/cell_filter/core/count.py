@@ -13,40 +13,59 @@ class CellposeCounter():
     
     def __init__(
         self,
-        use_gpu: bool
+        use_gpu: bool,
+        flow_threshold: float = 0.0,
+        interp: bool = True
     ):
         """
         Initialize the Cellpose counter.
         
+        A flow_threshold of 0 skips Cellpose's flow-error quality check on the masks.
+        That check runs on the CPU after inference and can take longer than the network
+        itself. Only the number of nuclei is used here, so the small loss of mask QC
+        is an acceptable trade.
+        
         Args:
             use_gpu: Whether to use GPU for Cellpose
+            flow_threshold: Flow error threshold for mask QC (0 disables the QC step)
+            interp: Whether to interpolate during 2D dynamics (runs on the torch device)
         """
         self.model = models.CellposeModel(
             gpu=use_gpu,
             model_type="cyto3"
         )
+        self.flow_threshold = flow_threshold
+        self.interp = interp
     
     def count_nuclei(self, images: Union[np.ndarray, List[np.ndarray]], diameter: int) -> List[int]:
         """
         Count nuclei in one or more images using Cellpose.
         
+        All images are passed to Cellpose in one eval call. Crops are passed as they
+        are, without padding, so each one is normalized and segmented on its own pixels.
+        
         Args:
-            images: Single image or list of images to count nuclei in
-            wanted: Expected number of nuclei
+            images: Single image, (N, H, W) array or list of images to count nuclei in
+            diameter: Expected diameter of nuclei in pixels
             
         Returns:
             List of nuclei counts for each image
         """
-        # Convert single image to list
+        # Pass a list of 2D images so Cellpose never reads a stack as channels or z-planes
         if isinstance(images, np.ndarray):
-            images = [images]
+            images = [images] if images.ndim == 2 else list(images)
         
-        # Run Cellpose on all images
-        masks_list, _, _, _ = self.model.eval(
+        if len(images) == 0:
+            return []
+        
+        # Run Cellpose on all images; a list input returns one mask per image
+        masks_list = self.model.eval(
             images,
             diameter=diameter,
-            channels=[0, 0]
-        )
+            channels=[0, 0],
+            flow_threshold=self.flow_threshold,
+            interp=self.interp
+        )[0]
         
         # Count nuclei in each image
         counts = []
@@ -54,4 +73,4 @@ class CellposeCounter():
             count = np.unique(masks).size - 1 if masks.size > 0 else 0
             counts.append(count)
 
-        return counts
\ No newline at end of file
+        return counts
@@ -3,13 +3,16 @@ Core extractor functionality for cell-filter.
 """
 
 import json
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
+import cv2
 import numpy as np
-from imageio.v3 import imwrite
-import warnings
 from .generate import CellGenerator, CellGeneratorParameters
+from .time_series import decode_time_series
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple, Union
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -29,14 +32,20 @@ class Extractor:
         output_folder (str): Path to save extracted frames
     """
 
+    # Number of threads writing finished sequences to disk within a view
+    WRITE_WORKERS = 4
+    
+    # Maximum number of consecutive frames read from the ND2 file in one slab
+    SLAB_FRAMES = 8
+
     # =====================================================================
     # Constructor and Initialization
     # =====================================================================
 
     def __init__(
         self,
-        patterns_path: str,
-        cells_path: str,
+        patterns_path: Union[str, Path],
+        cells_path: Union[str, Path],
         output_folder: str,
         nuclei_channel: int,
         cyto_channel: int
@@ -45,8 +54,8 @@ class Extractor:
         Initialize the Extractor with paths to pattern and cell images.
         
         Args:
-            patterns_path (str): Path to the patterns ND2 file
-            cells_path (str): Path to the cells ND2 file containing nuclei and cytoplasm channels
+            patterns_path (Union[str, Path]): Path to the patterns ND2 file
+            cells_path (Union[str, Path]): Path to the cells ND2 file containing nuclei and cytoplasm channels
             output_folder (str): Path to save extracted frames
             
         Raises:
@@ -55,6 +64,13 @@ class Extractor:
         self.patterns_path = str(Path(patterns_path).resolve())
         self.cells_path = str(Path(cells_path).resolve())
         self.output_folder = str(Path(output_folder).resolve())
+        self._worker_kwargs = dict(
+            patterns_path=self.patterns_path,
+            cells_path=self.cells_path,
+            output_folder=self.output_folder,
+            nuclei_channel=nuclei_channel,
+            cyto_channel=cyto_channel
+        )
         try:
             self.generator = CellGenerator(
                 patterns_path,
@@ -73,19 +89,19 @@ class Extractor:
     # Private Methods
     # =====================================================================
 
-    def _refine_time_series(self, time_series: Dict[int, List[int]], min_frames:int ) -> Dict[int, List[int]]:
+    def _refine_time_series(self, time_series: Dict[int, List[int]], min_frames:int ) -> Dict[Tuple[int, int], List[int]]:
         """
         Refine the time lapse dictionary by applying modifications to the frame indices.
         Splits time lapses when gaps between consecutive frames are larger than 6.
         Fills in missing frames when gaps are small (≤6) to create continuous sequences.
         Only stores the start and end frames of each sequence.
-        Pattern indices are formatted with leading zeros (e.g., 000, 001).
+        Each sequence is keyed by its pattern index and its position within the pattern.
         
         Args:
             time_series (Dict[int, List[int]]): Dictionary mapping pattern indices to frame indices
             
         Returns:
-            Dict[int, List[int]]: Refined time lapse dictionary with split sequences,
+            Dict[Tuple[int, int], List[int]]: Refined time lapse dictionary with split sequences keyed by (pattern_idx, sequence_idx),
                                  each sequence represented by [start_frame, end_frame]
         """
         MAX_GAP = 6
@@ -96,137 +112,197 @@ class Extractor:
                 continue
                 
             # Sort frames to ensure chronological order
-            frames.sort()
-            
-            # Initialize variables for current sequence
-            sequence_start = frames[0]
-            current_end = frames[0]
-            sequences = []
+            frames = np.sort(np.asarray(frames))
             
-            # Process frames to find gaps
-            for i in range(1, len(frames)):
-                gap = frames[i] - frames[i-1]
-                if gap > MAX_GAP:
-                    # Large gap found, save current sequence and start new one
-                    sequences.append([sequence_start, current_end])
-                    sequence_start = frames[i]
-                    current_end = frames[i]
-                else:
-                    current_end = frames[i]
+            # Split into sequences wherever the gap between consecutive frames is too large
+            splits = np.flatnonzero(np.diff(frames) > MAX_GAP) + 1
+            starts = frames[np.r_[0, splits]].tolist()
+            ends = frames[np.r_[splits - 1, frames.size - 1]].tolist()
+            sequences = list(zip(starts, ends))
             
-            # Add the last sequence
-            sequences.append([sequence_start, current_end])
-            
-            # Add sequences to refined time lapse with new pattern indices
+            # Add sequences to refined time lapse keyed by pattern and sequence index
             for i, (start, end) in enumerate(sequences):
-                # Format pattern index with leading zeros (3 digits)
                 if end - start <= min_frames:
                     continue
-                new_pattern_idx = int(f"{pattern_idx:03d}{i:03d}")
-                refined_time_series[new_pattern_idx] = [start, end]
+                refined_time_series[(pattern_idx, i)] = [start, end]
                 
                 logger.debug(f"Split pattern {pattern_idx} into {len(sequences)} sequences")
                 logger.debug(f"Sequence {i}: frames {start} to {end}")
                 
         return refined_time_series
 
-    def _add_head_tail(self, time_series: Dict[int, List[int]], n_frames: int = 3) -> Dict[int, List[int]]:
+    def _add_head_tail(self, time_series: Dict[Tuple[int, int], List[int]], n_frames: int = 3) -> Dict[Tuple[int, int], List[int]]:
         """
         Add extra frames at the beginning and end of each sequence for better inspection.
         
         Args:
-            time_series (Dict[int, List[int]]): Dictionary mapping pattern indices to [start_frame, end_frame]
+            time_series (Dict[Tuple[int, int], List[int]]): Dictionary mapping (pattern_idx, sequence_idx) to [start_frame, end_frame]
             n_frames (int): Number of extra frames to add at each end (default: 3)
             
         Returns:
-            Dict[int, List[int]]: Time lapse dictionary with added head and tail frames
+            Dict[Tuple[int, int], List[int]]: Time lapse dictionary with added head and tail frames
         """
         extended_time_series = {}
         
         # Get total number of frames from the generator
         total_frames = self.generator.n_frames
         
-        for pattern_idx, (start, end) in time_series.items():
+        for (pattern_idx, sequence_idx), (start, end) in time_series.items():
             # Add head frames (before start)
             new_start = max(0, start - n_frames)
             
             # Add tail frames (after end), but don't exceed total_frames
             new_end = min(total_frames - 1, end + n_frames)
             
-            extended_time_series[pattern_idx] = [new_start, new_end]
+            extended_time_series[(pattern_idx, sequence_idx)] = [new_start, new_end]
             
-            logger.debug(f"Extended pattern {pattern_idx} with {start-new_start} head frames and {new_end-end} tail frames")
+            logger.debug(f"Extended pattern {pattern_idx} sequence {sequence_idx} with {start-new_start} head frames and {new_end-end} tail frames")
             
         return extended_time_series
     
-    def _extract_frame_stack(self,
-                             pattern_idx: int,
-                             start_frame: int,
-                             end_frame: int,
-                             frame_output_path: Path,
-                             json_output_path: Path) -> None:
+    def _output_paths(self, extraction_dir: Path, view_idx: int, pattern_idx: int, sequence_idx: int) -> Tuple[Path, Path]:
         """
-        Extract and save frame stack for a given pattern.
+        Get the output paths of a pattern sequence.
+        
+        Args:
+            extraction_dir (Path): Directory holding the extracted sequences
+            view_idx (int): View index
+            pattern_idx (int): Index of the pattern
+            sequence_idx (int): Index of the sequence within the pattern
+            
+        Returns:
+            Tuple[Path, Path]: Paths of the .npy frame stack and the .json frame indices
         """
+        filename_prefix = f"view_{view_idx:03d}_pattern_{pattern_idx:03d}_{sequence_idx:03d}"
+        return extraction_dir / f"{filename_prefix}.npy", extraction_dir / f"{filename_prefix}.json"
 
-        pattern = self.generator.extract_pattern(pattern_idx) # (h, w)
-
-        # Initialize stacks for nuclei and cytoplasm
-        nuclei_stack = []
-        cyto_stack = []
-        # Extract frames
-        for frame_idx in range(start_frame, end_frame + 1):
-            # Load and extract both channels
-            self.generator.load_nuclei(frame_idx)
-            self.generator.load_cyto(frame_idx)
-            
-            nuclei = self.generator.extract_nuclei(pattern_idx)
-            cyto = self.generator.extract_cyto(pattern_idx)
+    def _is_extracted(self, frame_output_path: Path, json_output_path: Path, start_frame: int, end_frame: int, frame_stride: int, patterns_signature: str) -> bool:
+        """
+        Check whether a sequence was already extracted with the same frame range and patterns.
+        
+        Args:
+            frame_output_path (Path): Path of the .npy frame stack
+            json_output_path (Path): Path of the .json frame indices
+            start_frame (int): First frame of the sequence
+            end_frame (int): Last frame of the sequence
+            frame_stride (int): Step between extracted frames
+            patterns_signature (str): Signature of the detected patterns of the view
             
-            nuclei_stack.append(nuclei)
-            cyto_stack.append(cyto)
+        Returns:
+            bool: True if both outputs exist and the recorded frame range, stride and patterns match
+        """
+        if not frame_output_path.is_file() or not json_output_path.is_file():
+            return False
+        try:
+            with open(json_output_path, 'r') as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            return False
+        return (metadata.get("start_frame") == start_frame and metadata.get("end_frame") == end_frame
+                and metadata.get("frame_stride", 1) == frame_stride
+                and metadata.get("patterns_signature") == patterns_signature)
+
+    def _new_frame_stack(self, pattern_idx: int, n_frames: int, frame_output_path: Path) -> np.memmap:
+        """
+        Create the output stack of a pattern sequence on disk with the pattern channel filled in.
+        
+        The stack is a memory-mapped .npy file next to its final path, so nuclei and
+        cytoplasm regions are written through to disk as frames are read and memory use
+        stays independent of the sequence length.
+        
+        Args:
+            pattern_idx (int): Index of the pattern
+            n_frames (int): Number of frames in the sequence
+            frame_output_path (Path): Final path of the .npy frame stack
             
-        # Convert stacks to numpy arrays
-        nuclei_stack = np.array(nuclei_stack) # (n_frames, h, w)
-        cyto_stack = np.array(cyto_stack) # (n_frames, h, w)
+        Returns:
+            np.memmap: Stack of shape (n_frames, 3, h, w) with channels [pattern, nuclei, cyto]
+        """
+        pattern = self.generator.extract_pattern(pattern_idx) # (h, w)
+        frame_stack = np.lib.format.open_memmap(
+            frame_output_path.with_suffix(".npy.tmp"),
+            mode='w+',
+            dtype=np.result_type(pattern.dtype, self.generator.dtype),
+            shape=(n_frames, 3) + pattern.shape
+        )
         
-        # Calculate number of frames in this sequence
-        n_frames = end_frame - start_frame + 1
+        # The pattern is broadcast over the frames on assignment instead of being copied per frame
+        frame_stack[:, 0] = pattern
+        return frame_stack
+
+    def _discard_frame_stack(self, frame_stack: Optional[np.memmap]) -> None:
+        """
+        Remove the temporary file of a sequence that could not be completed.
+        
+        Args:
+            frame_stack (Optional[np.memmap]): Stack created by _new_frame_stack, if any
+        """
+        if frame_stack is not None:
+            Path(frame_stack.filename).unlink(missing_ok=True)
 
-        # Expand pattern to match frame dimensions
-        pattern_expanded = np.broadcast_to(
-            pattern[np.newaxis, :, :], 
-            (n_frames, pattern.shape[0], pattern.shape[1])
-        )  # (n_frames, h, w)
+    def _save_frame_stack(self,
+                          pattern_idx: int,
+                          start_frame: int,
+                          end_frame: int,
+                          frame_stride: int,
+                          patterns_signature: str,
+                          frame_stack: np.memmap,
+                          frame_output_path: Path,
+                          json_output_path: Path) -> None:
+        """
+        Save the frame stack collected for a pattern sequence.
         
-        # Stack all three channels: [pattern, nuclei, cyto]
-        final_stack = np.stack([pattern_expanded, nuclei_stack, cyto_stack], axis=1)  # (n_frames, 3, h, w)
+        Args:
+            pattern_idx (int): Index of the pattern
+            start_frame (int): First frame of the sequence
+            end_frame (int): Last frame of the sequence
+            frame_stride (int): Step between extracted frames
+            patterns_signature (str): Signature of the detected patterns the regions were cut from
+            frame_stack (np.memmap): Stack created by _new_frame_stack
+            frame_output_path (Path): Path of the .npy frame stack
+            json_output_path (Path): Path of the .json frame indices
+        """
+        # Calculate number of frames in this sequence
+        n_frames = (end_frame - start_frame) // frame_stride + 1
         
-        # Save frame stack
-        np.save(frame_output_path, final_stack)
+        # Move the completed stack into place; it lives under a temporary name until now so
+        # an interrupted run never leaves a truncated stack next to the metadata of an earlier one
+        frame_stack.flush()
+        os.replace(frame_stack.filename, frame_output_path)
 
         # Save frame indices
         with open(json_output_path, 'w') as f:
             json.dump({
                 "start_frame": start_frame,
                 "end_frame": end_frame,
-                "n_frames": n_frames
+                "frame_stride": frame_stride,
+                "n_frames": n_frames,
+                "patterns_signature": patterns_signature
             }, f, indent=2)
 
         logger.info(f"Saved pattern {pattern_idx} frames from {start_frame} to {end_frame} to {frame_output_path}")
 
-    def _process_time_series(self, time_series: Dict, view_idx: int, output_dir: Path, min_frames: int) -> None:
+    def _process_time_series(self, time_series: Dict, view_idx: int, output_dir: Path, min_frames: int, frame_stride: int = 1, overwrite: bool = False) -> None:
         """
         Process a single time series JSON file.
         
+        Frames are visited in the outer loop and patterns in the inner loop, so every
+        frame needed by any sequence of the view is read from the ND2 file exactly once.
+        Consecutive frames are read as slabs of both channels, and each sequence copies
+        its region of a slab in one assignment into its memory-mapped output file.
+        Each sequence is handed to a writer thread as soon as its last frame has been
+        collected, so finishing its files overlaps with decoding the following frames.
+        Sequences whose outputs already exist with the same frame range and were cut
+        from the same detected patterns are skipped unless overwrite is set, so
+        interrupted runs can be resumed.
+        
         Args:
-            data (Dict): Time series data
+            time_series (Dict): Time series data
             view_idx (int): View index
             output_dir (Path): Directory to save extracted frames
             min_frames (int): Minimum number of frames required for extraction
-            
-        Raises:
-            ValueError: If processing fails
+            frame_stride (int): Step between extracted frames
+            overwrite (bool): Whether to extract sequences that already have outputs
         """     
         # Refine time lapse
         time_series = self._refine_time_series(time_series, min_frames)
@@ -234,35 +310,187 @@ class Extractor:
         # Add head and tail frames
         time_series = self._add_head_tail(time_series)
         
-        # Load view and patterns
+        # Move each end back onto the stride so it is the last frame actually extracted
+        time_series = {
+            sequence_key: [start_frame, end_frame - (end_frame - start_frame) % frame_stride]
+            for sequence_key, (start_frame, end_frame) in time_series.items()
+        }
+        
+        extraction_dir = output_dir / 'extraction'
+        
+        # Outputs cut from patterns detected differently, e.g. after a detection change, are stale
         self.generator.load_view(view_idx)
+        patterns_signature = self.generator._patterns_signature()
+        
+        # Skip sequences that were extracted by a previous run
+        if not overwrite:
+            done = [
+                sequence_key for sequence_key, (start_frame, end_frame) in time_series.items()
+                if self._is_extracted(
+                    *self._output_paths(extraction_dir, view_idx, *sequence_key),
+                    start_frame,
+                    end_frame,
+                    frame_stride,
+                    patterns_signature
+                )
+            ]
+            for sequence_key in done:
+                del time_series[sequence_key]
+            if done:
+                logger.info(f"Skipping {len(done)} already extracted sequences for view {view_idx}")
+        
+        if not time_series:
+            logger.info(f"No sequences to extract for view {view_idx}")
+            return
+        
+        # Load patterns; detected patterns are cached per view for reruns
         self.generator.load_patterns()
-        self.generator.process_patterns()
+        cache_path = output_dir / '.cache' / f"view_{view_idx:03d}.npz"
+        if not self.generator.load_patterns_cache(cache_path):
+            self.generator.process_patterns()
+            self.generator.save_patterns_cache(cache_path)
         
-        # Process each pattern
-        for pattern_sequence_idx, (start_frame, end_frame) in time_series.items():
-            # Extract original pattern index and sequence number
-            pattern_idx = pattern_sequence_idx // 1000
-            sequence_idx = pattern_sequence_idx % 1000
-
-            # Filenames and directories
-            filename_prefix = f"view_{view_idx:03d}_pattern_{pattern_idx:03d}_{sequence_idx:03d}"
-            extraction_dir = output_dir / 'extraction'
-            extraction_dir.mkdir(parents=True, exist_ok=True)
-            frame_output_path = extraction_dir / f"{filename_prefix}.npy"
-            json_output_path = extraction_dir / f"{filename_prefix}.json"
+        extraction_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Per-sequence output stacks, created when the first frame of a sequence is read
+        stacks: Dict[Tuple[int, int], Optional[np.memmap]] = dict.fromkeys(time_series)
+        needed_frames = sorted({
+            frame_idx
+            for start_frame, end_frame in time_series.values()
+            for frame_idx in range(start_frame, end_frame + 1, frame_stride)
+        })
+        
+        write_pool = ThreadPoolExecutor(max_workers=self.WRITE_WORKERS)
+        writes: Dict[Future, int] = {}
+        
+        # Split the needed frames into runs of consecutive frames, at most SLAB_FRAMES long
+        slabs: List[List[int]] = []
+        for frame_idx in needed_frames:
+            if slabs and frame_idx == slabs[-1][1] + 1 and frame_idx - slabs[-1][0] < self.SLAB_FRAMES:
+                slabs[-1][1] = frame_idx
+            else:
+                slabs.append([frame_idx, frame_idx])
+        channels = [self.generator.parameters.nuclei_channel, self.generator.parameters.cyto_channel]
+        
+        for slab_start, slab_end in slabs:
+            active = [
+                sequence_key for sequence_key, (start_frame, end_frame) in time_series.items()
+                if start_frame <= slab_end and end_frame >= slab_start and sequence_key in stacks
+            ]
+            if not active:
+                continue
             
+            # Load both channels of the slab once for all sequences covering it
             try:
-                self._extract_frame_stack(
-                    pattern_idx=pattern_idx,
-                    start_frame=start_frame,
-                    end_frame=end_frame,
-                    frame_output_path=frame_output_path,
-                    json_output_path=json_output_path,
-                )
+                slab = self.generator.read_slab(slab_start, slab_end, channels) # (n, 2, H, W)
             except Exception as e:
-                logger.warning(f"Error processing pattern {pattern_idx}: {e}")
+                logger.warning(f"Error loading frames {slab_start} to {slab_end}: {e}")
+                for sequence_key in active:
+                    self._discard_frame_stack(stacks.pop(sequence_key))
                 continue
+            
+            for sequence_key in active:
+                pattern_idx, sequence_idx = sequence_key
+                start_frame, end_frame = time_series[sequence_key]
+                
+                # Filenames
+                frame_output_path, json_output_path = self._output_paths(extraction_dir, view_idx, pattern_idx, sequence_idx)
+                
+                try:
+                    frame_stack = stacks[sequence_key]
+                    if frame_stack is None:
+                        frame_stack = self._new_frame_stack(pattern_idx, (end_frame - start_frame) // frame_stride + 1, frame_output_path)
+                        stacks[sequence_key] = frame_stack
+                    
+                    # Copy nuclei and cytoplasm regions of the overlapping frames on the stride
+                    first = max(start_frame, slab_start)
+                    first += -(first - start_frame) % frame_stride
+                    last = min(end_frame, slab_end)
+                    last -= (last - start_frame) % frame_stride
+                    if first > last:
+                        continue
+                    regions = self.generator.extract_slab(slab[first - slab_start:last - slab_start + 1:frame_stride], pattern_idx)
+                    frame_stack[(first - start_frame) // frame_stride:(last - start_frame) // frame_stride + 1, 1:] = regions
+                    
+                    if last == end_frame:
+                        future = write_pool.submit(
+                            self._save_frame_stack,
+                            pattern_idx=pattern_idx,
+                            start_frame=start_frame,
+                            end_frame=end_frame,
+                            frame_stride=frame_stride,
+                            patterns_signature=patterns_signature,
+                            frame_stack=frame_stack,
+                            frame_output_path=frame_output_path,
+                            json_output_path=json_output_path,
+                        )
+                        writes[future] = pattern_idx
+                        del stacks[sequence_key]
+                except Exception as e:
+                    logger.warning(f"Error processing pattern {pattern_idx}: {e}")
+                    self._discard_frame_stack(stacks.pop(sequence_key))
+                    continue
+        
+        # Wait for pending writes before the next view replaces the patterns
+        write_pool.shutdown(wait=True)
+        for future, pattern_idx in writes.items():
+            e = future.exception()
+            if e is not None:
+                logger.warning(f"Error processing pattern {pattern_idx}: {e}")
+
+    def _process_time_series_file(self, json_file: Path, output_dir: Path, min_frames: int, frame_stride: int = 1, overwrite: bool = False) -> None:
+        """
+        Load a time series JSON file and extract the sequences of its view.
+        
+        Args:
+            json_file (Path): Path of the time series JSON file
+            output_dir (Path): Directory to save extracted frames
+            min_frames (int): Minimum number of frames required for extraction
+            frame_stride (int): Step between extracted frames
+            overwrite (bool): Whether to extract sequences that already have outputs
+        """
+        with open(json_file, 'r') as f:
+            data = json.load(f)
+        time_series = decode_time_series(data)
+        view_idx = int(json_file.stem.split('_')[-1])
+        logger.info(f"Processing time series for view {view_idx}")
+        self._process_time_series(time_series, view_idx, output_dir, min_frames, frame_stride, overwrite)
+
+    def _process_files_parallel(self, json_files: List[Path], output_dir: Path, min_frames: int, frame_stride: int, overwrite: bool, workers: int) -> None:
+        """
+        Process time series files in a pool of worker processes, one view per task.
+        
+        Args:
+            json_files (List[Path]): Time series JSON files to process
+            output_dir (Path): Directory to save extracted frames
+            min_frames (int): Minimum number of frames required for extraction
+            frame_stride (int): Step between extracted frames
+            overwrite (bool): Whether to extract sequences that already have outputs
+            workers (int): Number of worker processes
+            
+        Raises:
+            ValueError: If processing of a file fails
+        """
+        logger.debug(f"Starting parallel extraction of {len(json_files)} files with {workers} workers")
+        
+        # ND2 handles can't be pickled, so every worker opens its own Extractor
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self._worker_kwargs,)
+        ) as executor:
+            futures = {
+                executor.submit(_extract_file, json_file, output_dir, min_frames, frame_stride, overwrite): json_file
+                for json_file in json_files
+            }
+            for future in as_completed(futures):
+                json_file = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Error processing {json_file}: {e}")
+                    raise ValueError(f"Error processing {json_file}: {e}")
 
     # =====================================================================
     # Public Methods
@@ -270,21 +498,36 @@ class Extractor:
 
     def extract(
         self,
-        time_series_dir: str,
-        min_frames: int = 20
+        time_series_dir: Union[str, Path],
+        min_frames: int = 20,
+        frame_stride: int = 1,
+        workers: int = 1,
+        overwrite: bool = False
     ) -> None:
         """
         Extract valid frames and patterns for each pattern based on time series analysis results.
         Creates dual-channel outputs with nuclei in red and cytoplasm in green.
         Each time lapse gets its own directory named with view and pattern index.
         
+        Views are independent of each other, so with workers > 1 the time series files
+        are distributed over worker processes that each open their own ND2 readers.
+        
         Args:
-            time_series_dir (str): Directory containing time series JSON files
+            time_series_dir (Union[str, Path]): Directory containing time series JSON files
             min_frames (int): Minimum number of valid frames required for extraction (default: 20)
+            frame_stride (int): Step between extracted frames, e.g. 2 keeps every other frame (default: 1)
+            workers (int): Number of worker processes (1 processes views in this process)
+            overwrite (bool): Whether to re-extract sequences whose outputs already exist
+                with the same frame range (default: False)
             
         Raises:
             ValueError: If extraction fails
         """
+        if workers < 1:
+            raise ValueError(f"Number of workers must be at least 1, got {workers}")
+        if frame_stride < 1:
+            raise ValueError(f"Frame stride must be at least 1, got {frame_stride}")
+        
         try:
             # Create base output directory
             output_dir = Path(self.output_folder)
@@ -298,21 +541,52 @@ class Extractor:
                 
             logger.info(f"Found {len(json_files)} time series files")
             
+            if workers > 1:
+                self._process_files_parallel(json_files, output_dir, min_frames, frame_stride, overwrite, workers)
+                return
+            
             # Process each time series file
             for json_file in json_files:
                 try:
-                    with open(json_file, 'r') as f:
-                        data = json.load(f)
-                    time_series = {
-                        int(pattern_idx): frames for pattern_idx, frames in data['time_series'].items()
-                    }
-                    view_idx = int(json_file.stem.split('_')[-1])
-                    logger.info(f"Processing time series for view {view_idx}")
-                    self._process_time_series(time_series, view_idx, output_dir, min_frames)
+                    self._process_time_series_file(json_file, output_dir, min_frames, frame_stride, overwrite)
                 except Exception as e:
                     logger.error(f"Error processing {json_file}: {e}")
                     raise ValueError(f"Error processing {json_file}: {e}")
 
         except Exception as e:
             logger.error(f"Error during extraction: {e}")
-            raise ValueError(f"Error during extraction: {e}") 
\ No newline at end of file
+            raise ValueError(f"Error during extraction: {e}")
+
+
+# =====================================================================
+# Worker Processes
+# =====================================================================
+
+_worker_extractor: Optional[Extractor] = None
+
+def _init_worker(extractor_kwargs: Dict) -> None:
+    """
+    Build one Extractor, and with it one pair of ND2 readers, per worker process.
+    
+    Args:
+        extractor_kwargs (Dict): Keyword arguments for the Extractor constructor
+    """
+    # Views already run in parallel, so OpenCV's own thread pool would only oversubscribe the cores
+    cv2.setNumThreads(1)
+    global _worker_extractor
+    _worker_extractor = Extractor(**extractor_kwargs)
+
+def _extract_file(json_file: Path, output_dir: Path, min_frames: int, frame_stride: int, overwrite: bool) -> None:
+    """
+    Extract the sequences of a single time series file in a worker process.
+    
+    Args:
+        json_file (Path): Path of the time series JSON file
+        output_dir (Path): Directory to save extracted frames
+        min_frames (int): Minimum number of frames required for extraction
+        frame_stride (int): Step between extracted frames
+        overwrite (bool): Whether to extract sequences that already have outputs
+    """
+    if _worker_extractor is None:
+        raise RuntimeError("Worker extractor not initialized")
+    _worker_extractor._process_time_series_file(json_file, output_dir, min_frames, frame_stride, overwrite)
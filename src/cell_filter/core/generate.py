@@ -2,13 +2,15 @@
 Core cell generator functionality for cell-filter.
 """
 
+import os
 import cv2
 import numpy as np
-from nd2reader import ND2Reader
-from typing import List, Tuple
+import nd2
+from typing import Any, List, Optional, Sequence, Tuple, Union
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -30,6 +32,7 @@ class CellGeneratorParameters:
         morph_dilate_size (Tuple[int, int]): Size of kernel for morphological dilation
         nuclei_channel (int): Channel index for nuclei
         cyto_channel (int): Channel index for cytoplasm
+        plane_cache_size (int): Number of decoded planes kept for repeated reads (0 disables the cache)
     """
     
     gaussian_blur_size: Tuple[int, int] = (11, 11)
@@ -41,6 +44,7 @@ class CellGeneratorParameters:
     morph_dilate_size: Tuple[int, int] = (5, 5)
     nuclei_channel: int = 1
     cyto_channel: int = 0
+    plane_cache_size: int = 4
 
 class CellGenerator:
     """
@@ -52,22 +56,28 @@ class CellGenerator:
     Attributes:
         patterns_path (str): Path to the patterns ND2 file
         cells_path (str): Path to the cell ND2 file
-        patterns_reader (ND2Reader): Reader for patterns ND2 file
-        cells_reader (ND2Reader): Reader for cells ND2 file
+        patterns_reader (nd2.ND2File): Reader for patterns ND2 file
+        cells_reader (nd2.ND2File): Reader for cells ND2 file
+        patterns_array (dask.array.Array): Lazy array over all planes of the patterns file
+        cells_array (dask.array.Array): Lazy array over all planes of the cells file
         n_views (int): Number of views in the files
         n_frames (int): Number of frames in the cells file
         current_view (int): Current view index
         current_frame (int): Current frame index
         patterns (Optional[np.ndarray]): Current patterns image
         n_patterns (int): Number of detected patterns
-        contours (Optional[List[np.ndarray]]): Pattern contours
-        bounding_boxes (Optional[List[Tuple[int, int, int, int]]]): Pattern bounding boxes
-        centers (Optional[List[Tuple[int, int]]]): Pattern centers
+        bounding_boxes (Optional[np.ndarray]): Pattern bounding boxes as an int32 array of (x, y, w, h) rows
+        region_slices (Optional[List[Tuple[slice, slice]]]): Precomputed (row, column) slices of each bounding box
+        centers (Optional[np.ndarray]): Pattern centers as an int32 array of (y, x) rows
         frame_nuclei (Optional[np.ndarray]): Current nuclei frame
         frame_cyto (Optional[np.ndarray]): Current cytoplasm frame
         parameters (CellGeneratorParameters): Parameters for image processing and cell detection
     """
 
+    # Version of the pattern detection algorithm, part of the patterns cache signature.
+    # Bump it whenever a change to detection can change the detected boxes.
+    DETECTION_VERSION = 4
+
     # =====================================================================
     # Constructor and Initialization
     # =====================================================================
@@ -94,6 +104,10 @@ class CellGenerator:
         self.cells_path = Path(cells_path).resolve()
         self.parameters = parameters
         
+        # Rectangular dilation element; morph_dilate_size is (rows, columns) while OpenCV takes (width, height)
+        rows, cols = parameters.morph_dilate_size
+        self._morph_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (cols, rows))
+        
         try:
             self._init_patterns()
             self._init_cells()
@@ -109,10 +123,12 @@ class CellGenerator:
     def _init_patterns(self) -> None:
         """Initialize the patterns reader and metadata."""
         try:
-            self.patterns_reader = ND2Reader(str(self.patterns_path))
-            self.pattern_channels = self.patterns_reader.sizes.get('c', 0)
-            self.pattern_frames = self.patterns_reader.sizes.get('t', 0)
-            self.pattern_views = self.patterns_reader.sizes.get('v', 0)
+            self.patterns_reader = nd2.ND2File(str(self.patterns_path))
+            self.patterns_array = self.patterns_reader.to_dask()
+            self.patterns_axes = tuple(self.patterns_reader.sizes)
+            self.pattern_channels = self.patterns_reader.sizes.get('C', 1)
+            self.pattern_frames = self.patterns_reader.sizes.get('T', 1)
+            self.pattern_views = self.patterns_reader.sizes.get('P', 1)
             logger.debug(f"Channels: {self.pattern_channels}, Frames: {self.pattern_frames}, Views: {self.pattern_views}")
         except Exception as e:
             logger.error(f"Error initializing patterns reader: {e}")
@@ -121,11 +137,13 @@ class CellGenerator:
     def _init_cells(self) -> None:
         """Initialize the cells reader and metadata."""
         try:
-            self.cells_reader = ND2Reader(str(self.cells_path))
-            self.cells_channels = self.cells_reader.sizes.get('c', 0)
-            self.cells_frames = self.cells_reader.sizes.get('t', 0)
-            self.cells_views = self.cells_reader.sizes.get('v', 0)
-            self.dtype = self.cells_reader.get_frame_2D(c=0, t=0, v=0).dtype
+            self.cells_reader = nd2.ND2File(str(self.cells_path))
+            self.cells_array = self.cells_reader.to_dask()
+            self.cells_axes = tuple(self.cells_reader.sizes)
+            self.cells_channels = self.cells_reader.sizes.get('C', 1)
+            self.cells_frames = self.cells_reader.sizes.get('T', 1)
+            self.cells_views = self.cells_reader.sizes.get('P', 1)
+            self.dtype = self.cells_reader.dtype
             logger.debug(f"Channels: {self.cells_channels}, Frames: {self.cells_frames}, Views: {self.cells_views}")
             logger.info(f"Data type: {self.dtype}")
         except Exception as e:
@@ -139,8 +157,8 @@ class CellGenerator:
         Raises:
             ValueError: If files don't meet the required specifications
         """
-        if self.pattern_channels != 0:
-            raise ValueError("Patterns ND2 file shouldn't have any channels")
+        if self.pattern_channels != 1:
+            raise ValueError("Patterns ND2 file must contain exactly 1 channel")
         if self.pattern_frames != 1:
             raise ValueError("Patterns ND2 file must contain exactly 1 frame")
         if self.pattern_views != self.cells_views:
@@ -159,17 +177,59 @@ class CellGenerator:
         self.patterns = None
         self.n_patterns = 0
         self.thresh = None
-        self.contours = None
         self.bounding_boxes = None
+        self.region_slices = None
         self.centers = None
         self.frame_nuclei = None
         self.frame_cyto = None
+        self._blur_buffer = None
+        self._thresh_buffer = None
+        self._clip_buffer = None
+        self._norm_buffer = None
+        self._labels_buffer = None
+        self._fill_buffer = None
+        self._plane_cache: OrderedDict = OrderedDict()
+        self._processed_patterns: Optional[Tuple[np.ndarray, ...]] = None
         logger.debug("Initialized memory variables")
 
     # =====================================================================
     # Private Methods
     # =====================================================================
 
+    def _read_plane(self, array: Any, axes: Tuple[str, ...], **coords: int) -> np.ndarray:
+        """
+        Read a single 2D plane from a lazy ND2 array.
+        
+        The nd2 package omits axes of size 1, so any axis that is not given in coords
+        (and is not Y or X) is read at index 0. Only the chunk holding the plane is decoded.
+        The last few planes are kept in an LRU cache and returned read-only, so reading
+        the same plane again does not decode its chunk again.
+        
+        Args:
+            array (dask.array.Array): Lazy array returned by ND2File.to_dask()
+            axes (Tuple[str, ...]): Axis names of the array, e.g. ('T', 'P', 'C', 'Y', 'X')
+            **coords (int): Index per axis name, e.g. T=0, P=1, C=0
+            
+        Returns:
+            np.ndarray: Plane of shape (Y, X)
+        """
+        key = (id(array), tuple(sorted(coords.items())))
+        plane = self._plane_cache.get(key)
+        if plane is not None:
+            self._plane_cache.move_to_end(key)
+            return plane
+        
+        index = tuple(slice(None) if axis in ('Y', 'X') else coords.get(axis, 0) for axis in axes)
+        plane = np.asarray(array[index].compute(scheduler='synchronous'))
+        
+        cache_size = self.parameters.plane_cache_size
+        if cache_size > 0:
+            plane.setflags(write=False)
+            self._plane_cache[key] = plane
+            while len(self._plane_cache) > cache_size:
+                self._plane_cache.popitem(last=False)
+        return plane
+
     def _normalize(self, image: np.ndarray) -> np.ndarray:
         """
         Normalize an image to a range of 0-255.
@@ -186,6 +246,7 @@ class CellGenerator:
         if image is None or image.size == 0:
             raise ValueError("Image must not be None or empty")
         
+        # Scale in the input dtype and truncate to uint8; scaling straight to CV_8U would round
         image = cv2.normalize(image, None, 0, 255, cv2.NORM_MINMAX) # type: ignore
         image = image.astype(np.uint8)
         return image
@@ -194,6 +255,11 @@ class CellGenerator:
         """
         Normalize an image to a range of 0-255.
         
+        Integer images of at most 16 bits take both percentiles from one histogram of
+        the nonzero pixels instead of masking and partitioning the image once per
+        percentile. The image is scaled in floating point and truncated to uint8, written
+        into a buffer kept on the generator.
+        
         Args:
             image (np.ndarray): Input image to normalize
             low (int): Lower percentile
@@ -203,126 +269,182 @@ class CellGenerator:
             np.ndarray: Normalized image
             
         Raises:
-            ValueError: If image is None or empty
+            ValueError: If image is None, empty or has no nonzero pixels
         """
         if image is None or image.size == 0:
             raise ValueError("Image must not be None or empty")
         
-        percentile_high = np.percentile(image[image>0], high)
-        percentile_low = np.percentile(image[image>0], low)
-        image = np.clip(image, percentile_low, percentile_high)
-        image = cv2.normalize(image, None, 0, 255, cv2.NORM_MINMAX) # type: ignore
-        image = image.astype(np.uint8)
+        if image.dtype in (np.uint8, np.uint16):
+            # Zero pixels are left out of the percentiles, so their bin is dropped
+            hist = np.bincount(image.ravel(), minlength=1)
+            hist[0] = 0
+            cumulative = np.cumsum(hist)
+            if cumulative[-1] == 0:
+                raise ValueError("Image has no nonzero pixels")
+            percentile_low = self._histogram_percentile(cumulative, low)
+            percentile_high = self._histogram_percentile(cumulative, high)
+        else:
+            nonzero = image[image > 0]
+            if nonzero.size == 0:
+                raise ValueError("Image has no nonzero pixels")
+            percentile_low, percentile_high = np.percentile(nonzero, [low, high])
+        
+        # Pattern images of all views share one shape, so the clip and output buffers are reused
+        clip_dtype = np.result_type(image, percentile_low, percentile_high)
+        if self._clip_buffer is None or self._clip_buffer.shape != image.shape or self._clip_buffer.dtype != clip_dtype:
+            self._clip_buffer = np.empty(image.shape, dtype=clip_dtype)
+            self._norm_buffer = np.empty(image.shape, dtype=np.uint8)
+        image = np.clip(image, percentile_low, percentile_high, out=self._clip_buffer)
+        image = cv2.normalize(image, image, 0, 255, cv2.NORM_MINMAX) # type: ignore
+        # Truncate like astype(np.uint8) rather than round, as detection was tuned on
+        np.copyto(self._norm_buffer, image, casting='unsafe')
+        image = self._norm_buffer
 
         return image
 
-    def _find_contours(self, image: np.ndarray) -> Tuple[List[np.ndarray], np.ndarray]:
+    def _histogram_percentile(self, cumulative: np.ndarray, q: float) -> float:
+        """
+        Compute a percentile from the cumulative histogram of an integer image.
+        
+        Matches np.percentile with linear interpolation between the two closest ranks.
+        
+        Args:
+            cumulative (np.ndarray): Cumulative pixel count per value
+            q (float): Percentile in the range 0-100
+            
+        Returns:
+            float: Percentile value
+        """
+        n = int(cumulative[-1])
+        rank = q / 100 * (n - 1)
+        lower = int(np.floor(rank))
+        upper = min(lower + 1, n - 1)
+        value_low, value_high = np.searchsorted(cumulative, [lower, upper], side='right')
+        return float(value_low + (value_high - value_low) * (rank - lower))
+
+    def _find_components(self, image: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Find contours in an image using thresholding and contour detection.
+        Find pattern components in an image using thresholding and connected component labeling.
+        
+        Only the bounding box and area of each pattern are used downstream, and
+        connectedComponentsWithStats returns both in one pass over the image instead
+        of tracing every contour and measuring it afterwards. Holes in the mask are
+        filled first, so specks inside a pattern are not reported as components of
+        their own, as with the outer contours (RETR_EXTERNAL) used before.
+        
+        The area of a component is its pixel count including filled holes. This is
+        larger than the polygon area contourArea gave for the same outline (w * h
+        instead of (w - 1) * (h - 1) for a filled rectangle), which shifts the mean
+        area used by the area ratio filter slightly.
         
         Args:
-            image (np.ndarray): Input image to find contours in
+            image (np.ndarray): Input image to find components in
             
         Returns:
-            List[np.ndarray]: List of detected contours
+            Tuple[np.ndarray, np.ndarray]: Component stats of shape (n, 5) as (x, y, w, h, area)
+                without the background, and the thresholded image (a buffer reused by the next call)
             
         Raises:
             ValueError: If image is None or empty
         """
         if image is None or image.size == 0:
             raise ValueError("Image must not be None or empty")
+        
+        # Pattern images of all views share one shape, so the intermediate buffers are reused
+        if self._blur_buffer is None or self._blur_buffer.shape != image.shape or self._blur_buffer.dtype != image.dtype:
+            self._blur_buffer = np.empty_like(image)
+            self._thresh_buffer = np.empty_like(image)
+            self._labels_buffer = np.empty(image.shape, dtype=np.int32)
+            self._fill_buffer = np.empty((image.shape[0] + 2, image.shape[1] + 2), dtype=np.uint8)
             
         # Apply Gaussian blur to reduce noise
-        blur = cv2.GaussianBlur(image, self.parameters.gaussian_blur_size, 0)
+        blur = cv2.GaussianBlur(image, self.parameters.gaussian_blur_size, 0, dst=self._blur_buffer)
 
         # Apply thresholding
-        _, thresh = cv2.threshold(blur, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        _, thresh = cv2.threshold(blur, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=self._thresh_buffer)
 
         # Apply morphological operations
-        kernel = np.ones(self.parameters.morph_dilate_size, np.uint8)
-        thresh = cv2.morphologyEx(thresh, cv2.MORPH_DILATE, kernel)
+        thresh = cv2.dilate(thresh, self._morph_kernel, dst=thresh)
+
+        # Fill holes: flood the background from a zero border, anything left unreached is enclosed
+        fill = self._fill_buffer
+        fill.fill(0)
+        fill[1:-1, 1:-1] = thresh
+        cv2.floodFill(fill, None, (0, 0), 255)
+        holes = cv2.bitwise_not(fill[1:-1, 1:-1])
+        thresh = cv2.bitwise_or(thresh, holes, dst=thresh)
 
-        # Find contours
-        contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        # Label 8-connected components, matching the outer contours findContours would trace
+        _, _, stats, _ = cv2.connectedComponentsWithStats(thresh, self._labels_buffer, connectivity=8, ltype=cv2.CV_32S)
+        stats = stats[1:]
 
-        logger.debug(f"Found {len(contours)} contours in image")
+        logger.debug(f"Found {len(stats)} components in image")
         
-        return list(contours), thresh
+        return stats, thresh
 
-    def _refine_contours(self, contours: List[np.ndarray], image_shape: Tuple[int, int]) -> List[Tuple[int, int, np.ndarray, Tuple[int, int, int, int]]]:
+    def _refine_components(self, stats: np.ndarray, image_shape: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Refine contours by filtering based on area and calculating centers.
+        Refine components by filtering based on area and calculating centers.
         
         Args:
-            contours (List[np.ndarray]): List of contours to refine
+            stats (np.ndarray): Component stats of shape (n, 5) as (x, y, w, h, area), with the
+                area in pixels
             image_shape (Tuple[int, int]): Shape of the image (height, width)
             
         Returns:
-            List[Tuple[int, int, np.ndarray, Tuple[int, int, int, int]]]: List of (center_y, center_x, contour, bounding_box)
+            Tuple[np.ndarray, np.ndarray]: Bounding boxes of shape (n, 4) as (x, y, w, h) and centers
+                of shape (n, 2) as (y, x), both int32 and sorted by center
             
         Raises:
-            ValueError: If contours list is empty
+            ValueError: If no components are provided
         """
-        if not contours:
-            raise ValueError("No contours provided")
+        if len(stats) == 0:
+            raise ValueError("No components provided")
             
-        # Calculate areas
-        areas = np.array([cv2.contourArea(contour) for contour in contours])
+        # Filtering below only updates a mask over the areas; pixel counts are exact in float32
+        areas = stats[:, cv2.CC_STAT_AREA].astype(np.float32)
+        keep = np.ones(len(stats), dtype=bool)
         
         # Iteratively remove small and large areas until CV falls below threshold
-        current_contours = list(contours)
-        current_areas = areas.copy()
         iteration = 0
         cv = float('inf')
         
         for iteration in range(self.parameters.max_iterations):
-            cv = np.std(current_areas) / np.mean(current_areas)
+            current_areas = areas[keep]
+            mean_area = np.mean(current_areas)
+            cv = np.std(current_areas) / mean_area
             if cv < self.parameters.bimodal_threshold:
                 break
                 
-            # Remove areas smaller than min_area_ratio of mean
-            mean_area = np.mean(current_areas)
+            # Remove areas outside [min_area_ratio, max_area_ratio] of mean
             min_area = self.parameters.min_area_ratio * mean_area
             max_area = self.parameters.max_area_ratio * mean_area
+            keep &= (areas >= min_area) & (areas <= max_area)
             
-            # Create new lists of contours and areas
-            new_contours = []
-            new_areas = []
-            for i, (contour, area) in enumerate(zip(current_contours, current_areas)):
-                if area >= min_area and area <= max_area:
-                    new_contours.append(contour)
-                    new_areas.append(area)
-            
-            # Update for next iteration
-            current_contours = new_contours
-            current_areas = np.array(new_areas)
-            
-            if len(current_contours) == 0:
-                logger.warning("All contours were removed during iterative filtering")
+            if not keep.any():
+                logger.warning("All components were removed during iterative filtering")
                 break
                 
         logger.debug(f"After {iteration + 1} iterations, CV reduced to {cv:.3f}")
         
-        contour_data = []
-        for contour in current_contours:
-            x, y, w, h = cv2.boundingRect(contour)
-            
-            # Skip if too close to edges
-            if (x < self.parameters.edge_tolerance or 
-                y < self.parameters.edge_tolerance or 
-                x + w > image_shape[1] - self.parameters.edge_tolerance or 
-                y + h > image_shape[0] - self.parameters.edge_tolerance):
-                continue
-                
-            center_x = x + w // 2
-            center_y = y + h // 2
-            contour_data.append((center_y, center_x, contour, (x, y, w, h)))
-
-        # Sort contours by center
-        contour_data.sort(key=lambda x: (x[0], x[1]))
+        # Bounding boxes of the remaining components as an (N, 4) int32 array of (x, y, w, h)
+        boxes = stats[keep, :4]
+        x, y, w, h = boxes.T
+        
+        # Skip components too close to edges
+        tolerance = self.parameters.edge_tolerance
+        inside = ((x >= tolerance) & (y >= tolerance) &
+                  (x + w <= image_shape[1] - tolerance) &
+                  (y + h <= image_shape[0] - tolerance))
+        boxes = boxes[inside]
+        centers = np.column_stack((boxes[:, 1] + boxes[:, 3] // 2, boxes[:, 0] + boxes[:, 2] // 2))
+        
+        # Sort components by center (row first, then column)
+        order = np.lexsort((centers[:, 1], centers[:, 0]))
+        boxes, centers = boxes[order], centers[order]
             
-        logger.debug(f"Filtered {len(contours)} contours to {len(contour_data)} using iterative area analysis")
-        return contour_data
+        logger.debug(f"Filtered {len(stats)} components to {len(boxes)} using iterative area analysis")
+        return boxes, centers
     
     def _extract_region(self, frame: np.ndarray, pattern_idx: int, normalize: bool) -> np.ndarray:
         """
@@ -340,14 +462,13 @@ class CellGenerator:
         """
         if frame is None:
             raise ValueError("Frame not provided")
-        if pattern_idx >= self.n_patterns or pattern_idx < 0:
+        if not 0 <= pattern_idx < self.n_patterns:
             raise ValueError(f"Pattern index {pattern_idx} out of range (0-{self.n_patterns-1})")
-        if self.bounding_boxes is None:
+        if self.region_slices is None:
             raise ValueError("No bounding boxes provided")
         
         try:
-            x, y, w, h = self.bounding_boxes[pattern_idx]
-            region = frame[y:y+h, x:x+w]
+            region = frame[self.region_slices[pattern_idx]]
             if normalize:
                 region = self._normalize(region)
             return region
@@ -355,12 +476,115 @@ class CellGenerator:
             logger.error(f"Error extracting region: {e}")
             raise ValueError(f"Error extracting region: {e}")
 
+    def _extract_regions(self, frame: np.ndarray, pattern_indices: Sequence[int], normalize: bool) -> List[np.ndarray]:
+        """
+        Extract the regions of several patterns from a frame with basic slicing.
+        
+        Args:
+            frame (np.ndarray): Frame to extract regions from
+            pattern_indices (Sequence[int]): Indices of the patterns to extract (list or integer array)
+            normalize (bool): Whether to normalize each region to 0-255
+            
+        Returns:
+            List[np.ndarray]: Extracted regions in the order of pattern_indices (views if not normalized)
+            
+        Raises:
+            ValueError: If frame is None or a pattern index is invalid
+        """
+        if frame is None:
+            raise ValueError("Frame not provided")
+        if self.region_slices is None:
+            raise ValueError("No bounding boxes provided")
+        if len(pattern_indices) == 0:
+            return []
+        if np.min(pattern_indices) < 0 or np.max(pattern_indices) >= self.n_patterns:
+            raise ValueError(f"Pattern indices out of range (0-{self.n_patterns-1})")
+        
+        region_slices = self.region_slices
+        regions = [frame[region_slices[pattern_idx]] for pattern_idx in pattern_indices]
+        if normalize:
+            regions = [self._normalize(region) for region in regions]
+        return regions
+
+    def _gather_regions(self, frame: np.ndarray, normalize: bool) -> Union[np.ndarray, List[np.ndarray]]:
+        """
+        Extract the regions of all patterns from a frame into one contiguous stack.
+        
+        Patterns on a regular grid usually share one box size. In that case all regions
+        are gathered with a single fancy index into an (n_patterns, h, w) array instead
+        of being sliced one by one; otherwise the regions are returned as a list.
+        
+        Args:
+            frame (np.ndarray): Frame to extract regions from
+            normalize (bool): Whether to normalize each region to 0-255
+            
+        Returns:
+            Union[np.ndarray, List[np.ndarray]]: Stack of regions if all boxes have the same size,
+                otherwise a list of regions, in pattern order
+            
+        Raises:
+            ValueError: If frame is None or patterns haven't been processed
+        """
+        if frame is None:
+            raise ValueError("Frame not provided")
+        if self.bounding_boxes is None:
+            raise ValueError("No bounding boxes provided")
+        
+        x, y, w, h = self.bounding_boxes.T
+        if self.n_patterns == 0 or (w != w[0]).any() or (h != h[0]).any():
+            return self._extract_regions(frame, range(self.n_patterns), normalize)
+        
+        rows = y[:, np.newaxis, np.newaxis] + np.arange(h[0])[np.newaxis, :, np.newaxis]
+        cols = x[:, np.newaxis, np.newaxis] + np.arange(w[0])[np.newaxis, np.newaxis, :]
+        regions = frame[rows, cols]
+        if normalize:
+            # Each region is scaled by its own range, as with _normalize
+            normalized = np.empty(regions.shape, dtype=np.uint8)
+            for region, out in zip(regions, normalized):
+                out[...] = self._normalize(region)
+            regions = normalized
+        return regions
+
+    def _patterns_signature(self) -> str:
+        """
+        Describe everything the detected patterns of the current view depend on.
+        
+        Returns:
+            str: Signature of the patterns file, the view, the detection version and parameters
+        """
+        stat = self.patterns_path.stat()
+        detection_parameters = {
+            key: value for key, value in asdict(self.parameters).items()
+            if key not in ('nuclei_channel', 'cyto_channel', 'plane_cache_size')
+        }
+        return repr((
+            str(self.patterns_path), stat.st_size, stat.st_mtime_ns, self.current_view,
+            self.DETECTION_VERSION, detection_parameters
+        ))
+
+    def _set_pattern_data(self, bounding_boxes: np.ndarray, centers: np.ndarray) -> None:
+        """
+        Store the detected patterns and derive the region slices from their bounding boxes.
+        
+        Args:
+            bounding_boxes (np.ndarray): Pattern bounding boxes of shape (n_patterns, 4) as (x, y, w, h)
+            centers (np.ndarray): Pattern centers of shape (n_patterns, 2) as (y, x)
+        """
+        self.bounding_boxes = np.asarray(bounding_boxes, dtype=np.int32).reshape(-1, 4)
+        self.region_slices = [(slice(y, y + h), slice(x, x + w)) for x, y, w, h in self.bounding_boxes.tolist()]
+        self.centers = np.asarray(centers, dtype=np.int32).reshape(-1, 2)
+        self.n_patterns = len(self.bounding_boxes)
+
     # =====================================================================
     # Public Methods
     # =====================================================================
 
     def close_files(self) -> None:
         """Safely close all ND2 readers."""
+        if hasattr(self, '_plane_cache'):
+            self._plane_cache.clear()
+        if hasattr(self, '_processed_patterns'):
+            self._processed_patterns = None
         if hasattr(self, 'patterns_reader'):
             self.patterns_reader.close()
         if hasattr(self, 'cells_reader'):
@@ -390,30 +614,101 @@ class CellGenerator:
             ValueError: If loading fails
         """
         try:
-            self.patterns = self.patterns_reader.get_frame_2D(c=0, t=0, v=self.current_view)
+            self.patterns = self._read_plane(self.patterns_array, self.patterns_axes, P=self.current_view)
             logger.debug(f"Loaded patterns for view {self.current_view}")
         except Exception as e:
             logger.error(f"Error loading patterns: {e}")
             raise ValueError(f"Error loading patterns: {e}")
     
-    def load_nuclei(self, frame_idx: int) -> None:
+    def read_nuclei(self, frame_idx: int) -> np.ndarray:
         """
-        Load nuclei frame from ND2 file.
+        Read a nuclei frame from ND2 file without changing the generator state.
         
         Args:
-            frame_idx (int): Index of the frame to load
+            frame_idx (int): Index of the frame to read
+            
+        Returns:
+            np.ndarray: Nuclei frame of the current view
             
         Raises:
-            ValueError: If frame index is invalid or loading fails
+            ValueError: If frame index is invalid or reading fails
         """
         if frame_idx >= self.n_frames:
             raise ValueError(f"Frame index {frame_idx} out of range (0-{self.n_frames-1})")
         try:
-            self.frame_nuclei = self.cells_reader.get_frame_2D(c=self.parameters.nuclei_channel, t=frame_idx, v=self.current_view)
-            logger.debug(f"Loaded nuclei frame {frame_idx} for view {self.current_view} from channel {self.parameters.nuclei_channel}")
+            return self._read_plane(self.cells_array, self.cells_axes, T=frame_idx, P=self.current_view, C=self.parameters.nuclei_channel)
         except Exception as e:
             logger.error(f"Error loading nuclei: {e}")
             raise ValueError(f"Error loading nuclei: {e}")
+
+    def read_nuclei_crops(self, frame_idx: int, pattern_indices: Sequence[int], normalize: bool = False) -> List[np.ndarray]:
+        """
+        Read a nuclei frame and keep only the regions of the given patterns.
+        
+        The regions are copies, so the full frame can be released right after reading.
+        This keeps memory proportional to the surviving patterns when frames are buffered.
+        
+        Args:
+            frame_idx (int): Index of the frame to read
+            pattern_indices (Sequence[int]): Indices of the patterns to keep
+            normalize (bool): Whether to normalize each region to 0-255
+            
+        Returns:
+            List[np.ndarray]: Nuclei regions in the order of pattern_indices
+            
+        Raises:
+            ValueError: If frame index is invalid or reading fails
+        """
+        frame = self.read_nuclei(frame_idx)
+        regions = self._extract_regions(frame, pattern_indices, normalize)
+        if not normalize:
+            regions = [region.copy() for region in regions]
+        return regions
+
+    def read_slab(self, start_frame: int, end_frame: int, channels: Sequence[int]) -> np.ndarray:
+        """
+        Read consecutive frames of several channels of the current view in one pass.
+        
+        All channels of a time point live in the same ND2 chunk, so reading them together
+        decodes every chunk once instead of once per channel and frame.
+        
+        Args:
+            start_frame (int): First frame to read
+            end_frame (int): Last frame to read (inclusive)
+            channels (Sequence[int]): Channel indices to read, in output order
+            
+        Returns:
+            np.ndarray: Slab of shape (n_frames, n_channels, Y, X)
+            
+        Raises:
+            ValueError: If frame range is invalid or reading fails
+        """
+        if start_frame < 0 or end_frame >= self.n_frames or start_frame > end_frame:
+            raise ValueError(f"Frame range {start_frame}-{end_frame} out of range (0-{self.n_frames-1})")
+        coords = {'T': slice(start_frame, end_frame + 1), 'P': self.current_view, 'C': list(channels)}
+        index = tuple(slice(None) if axis in ('Y', 'X') else coords.get(axis, 0) for axis in self.cells_axes)
+        try:
+            slab = np.asarray(self.cells_array[index].compute(scheduler='synchronous'))
+        except Exception as e:
+            logger.error(f"Error loading frames: {e}")
+            raise ValueError(f"Error loading frames: {e}")
+        # Files with a single time point have no T axis
+        if 'T' not in self.cells_axes:
+            slab = slab[np.newaxis]
+        return slab
+
+    def load_nuclei(self, frame_idx: int) -> None:
+        """
+        Load nuclei frame from ND2 file.
+        
+        Args:
+            frame_idx (int): Index of the frame to load
+            
+        Raises:
+            ValueError: If frame index is invalid or loading fails
+        """
+        self.frame_nuclei = self.read_nuclei(frame_idx)
+        logger.debug(f"Loaded nuclei frame {frame_idx} for view {self.current_view} from channel {self.parameters.nuclei_channel}")
     
     def load_cyto(self, frame_idx: int) -> None:
         """
@@ -428,15 +723,19 @@ class CellGenerator:
         if frame_idx >= self.n_frames:
             raise ValueError(f"Frame index {frame_idx} out of range (0-{self.n_frames-1})")
         try:
-            self.frame_cyto = self.cells_reader.get_frame_2D(c=self.parameters.cyto_channel, t=frame_idx, v=self.current_view)
+            self.frame_cyto = self._read_plane(self.cells_array, self.cells_axes, T=frame_idx, P=self.current_view, C=self.parameters.cyto_channel)
             logger.debug(f"Loaded cytoplasm frame {frame_idx} for view {self.current_view} from channel {self.parameters.cyto_channel}")
         except Exception as e:
             logger.error(f"Error loading cyto: {e}")
             raise ValueError(f"Error loading cyto: {e}")
-        
+
     def process_patterns(self) -> None:
         """
-        Process pattern image to extract contours and their bounding boxes.
+        Process pattern image to detect patterns and their bounding boxes.
+        
+        Detection only depends on the patterns image, so calling this again while the
+        same image is loaded (e.g. once per frame) restores the previous result instead
+        of running the detection pipeline again.
         
         Raises:
             ValueError: If patterns haven't been loaded
@@ -444,15 +743,75 @@ class CellGenerator:
         if self.patterns is None:
             raise ValueError("Patterns must be loaded before processing")
         
+        if self._processed_patterns is not None and self._processed_patterns[0] is self.patterns:
+            _, self.patterns_norm, self.thresh, bounding_boxes, centers = self._processed_patterns
+            self._set_pattern_data(bounding_boxes, centers)
+            logger.debug(f"Reused {self.n_patterns} processed patterns")
+            return
+        
         self.patterns_norm = self._normalize_pct(self.patterns, 10, 90)
-        contours, self.thresh = self._find_contours(self.patterns_norm)
-        contour_data = self._refine_contours(contours, self.patterns_norm.shape)
-        self.contours = [x[2] for x in contour_data]
-        self.bounding_boxes = [x[3] for x in contour_data]
-        self.centers = [x[0:2] for x in contour_data]
-        self.n_patterns = len(self.contours)
+        stats, self.thresh = self._find_components(self.patterns_norm)
+        bounding_boxes, centers = self._refine_components(stats, self.patterns_norm.shape)
+        self._set_pattern_data(bounding_boxes, centers)
+        self._processed_patterns = (self.patterns, self.patterns_norm, self.thresh, self.bounding_boxes, self.centers)
         logger.debug(f"Processed {self.n_patterns} patterns")
 
+    def save_patterns_cache(self, cache_path: Path) -> None:
+        """
+        Save the detected patterns of the current view to a cache file.
+        
+        Args:
+            cache_path (Path): Path of the .npz cache file
+            
+        Raises:
+            ValueError: If patterns haven't been processed
+        """
+        if self.bounding_boxes is None:
+            raise ValueError("Patterns must be processed before caching")
+        
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_cache_path = cache_path.with_suffix(".npz.tmp")
+        with open(tmp_cache_path, 'wb') as f:
+            np.savez(
+                f,
+                signature=np.array(self._patterns_signature()),
+                bounding_boxes=self.bounding_boxes,
+                centers=self.centers
+            )
+        os.replace(tmp_cache_path, cache_path)
+        logger.debug(f"Saved {self.n_patterns} patterns of view {self.current_view} to {cache_path}")
+
+    def load_patterns_cache(self, cache_path: Path) -> bool:
+        """
+        Load the detected patterns of the current view from a cache file.
+        
+        The cache is only used if it was written for the same patterns file, view and
+        detection parameters. The threshold image is not cached and is left unset.
+        
+        Args:
+            cache_path (Path): Path of the .npz cache file
+            
+        Returns:
+            bool: True if the patterns were loaded, False if the cache is missing or stale
+        """
+        if not cache_path.is_file():
+            return False
+        try:
+            with np.load(cache_path, allow_pickle=False) as cache:
+                if str(cache["signature"]) != self._patterns_signature():
+                    logger.debug(f"Ignoring stale patterns cache {cache_path}")
+                    return False
+                bounding_boxes = cache["bounding_boxes"]
+                centers = cache["centers"]
+        except Exception as e:
+            logger.warning(f"Error loading patterns cache {cache_path}: {e}")
+            return False
+        
+        self.thresh = None
+        self._set_pattern_data(bounding_boxes, centers)
+        logger.debug(f"Loaded {self.n_patterns} patterns of view {self.current_view} from {cache_path}")
+        return True
+
     def extract_nuclei(self, pattern_idx: int, normalize: bool = False) -> np.ndarray:
         """
         Extract nuclei region for a specific pattern.
@@ -470,6 +829,44 @@ class CellGenerator:
             raise ValueError("Nuclei frame must be loaded before extraction")
         return self._extract_region(self.frame_nuclei, pattern_idx, normalize)
     
+    def extract_all_nuclei(self, normalize: bool = False) -> Union[np.ndarray, List[np.ndarray]]:
+        """
+        Extract the nuclei regions of all patterns.
+        
+        Args:
+            normalize (bool): Whether to normalize each region to 0-255
+            
+        Returns:
+            Union[np.ndarray, List[np.ndarray]]: (n_patterns, h, w) stack if all patterns have the
+                same box size, otherwise a list of regions, in pattern order
+            
+        Raises:
+            ValueError: If nuclei frame hasn't been loaded
+        """
+        if self.frame_nuclei is None:
+            raise ValueError("Nuclei frame must be loaded before extraction")
+        return self._gather_regions(self.frame_nuclei, normalize)
+    
+    def extract_slab(self, slab: np.ndarray, pattern_idx: int) -> np.ndarray:
+        """
+        Extract the region of a pattern from every frame and channel of a slab.
+        
+        Args:
+            slab (np.ndarray): Slab of shape (..., Y, X), e.g. from read_slab
+            pattern_idx (int): Index of the pattern to extract
+            
+        Returns:
+            np.ndarray: View of the slab of shape (..., h, w)
+            
+        Raises:
+            ValueError: If pattern index is invalid
+        """
+        if self.region_slices is None:
+            raise ValueError("No bounding boxes provided")
+        if not 0 <= pattern_idx < self.n_patterns:
+            raise ValueError(f"Pattern index {pattern_idx} out of range (0-{self.n_patterns-1})")
+        return slab[(Ellipsis,) + self.region_slices[pattern_idx]]
+
     def extract_cyto(self, pattern_idx: int, normalize: bool = False) -> np.ndarray:
         """
         Extract cytoplasm region for a specific pattern.
@@ -487,6 +884,24 @@ class CellGenerator:
             raise ValueError("Cytoplasm frame must be loaded before extraction")
         return self._extract_region(self.frame_cyto, pattern_idx, normalize)
 
+    def extract_all_cyto(self, normalize: bool = False) -> Union[np.ndarray, List[np.ndarray]]:
+        """
+        Extract the cytoplasm regions of all patterns.
+        
+        Args:
+            normalize (bool): Whether to normalize each region to 0-255
+            
+        Returns:
+            Union[np.ndarray, List[np.ndarray]]: (n_patterns, h, w) stack if all patterns have the
+                same box size, otherwise a list of regions, in pattern order
+            
+        Raises:
+            ValueError: If cytoplasm frame hasn't been loaded
+        """
+        if self.frame_cyto is None:
+            raise ValueError("Cytoplasm frame must be loaded before extraction")
+        return self._gather_regions(self.frame_cyto, normalize)
+
     def extract_pattern(self, pattern_idx: int, normalize: bool = False) -> np.ndarray:
         """
         Extract pattern region.
@@ -503,3 +918,21 @@ class CellGenerator:
         if self.patterns is None:
             raise ValueError("Patterns must be loaded before extraction")
         return self._extract_region(self.patterns, pattern_idx, normalize)
+
+    def extract_all_patterns(self, normalize: bool = False) -> Union[np.ndarray, List[np.ndarray]]:
+        """
+        Extract the pattern regions of all patterns.
+        
+        Args:
+            normalize (bool): Whether to normalize each region to 0-255
+            
+        Returns:
+            Union[np.ndarray, List[np.ndarray]]: (n_patterns, h, w) stack if all patterns have the
+                same box size, otherwise a list of regions, in pattern order
+            
+        Raises:
+            ValueError: If patterns haven't been loaded
+        """
+        if self.patterns is None:
+            raise ValueError("Patterns must be loaded before extraction")
+        return self._gather_regions(self.patterns, normalize)
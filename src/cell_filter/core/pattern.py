@@ -6,7 +6,7 @@ from pathlib import Path
 import numpy as np
 import matplotlib.pyplot as plt
 import cv2
-from typing import Optional
+from typing import Optional, Union
 import logging
 from .generate import CellGenerator, CellGeneratorParameters
 
@@ -32,8 +32,8 @@ class PatternDisplayer:
 
     def __init__(
         self,
-        patterns_path: str,
-        cells_path: str,
+        patterns_path: Union[str, Path],
+        cells_path: Union[str, Path],
         nuclei_channel: int,
         cyto_channel: int
     ) -> None:
@@ -41,8 +41,8 @@ class PatternDisplayer:
         Initialize the InfoDisplayer with paths to pattern and cell images.
         
         Args:
-            patterns_path (str): Path to the patterns ND2 file
-            cells_path (str): Path to the cells ND2 file containing nuclei and cytoplasm channels
+            patterns_path (Union[str, Path]): Path to the patterns ND2 file
+            cells_path (Union[str, Path]): Path to the cells ND2 file containing nuclei and cytoplasm channels
             
         Raises:
             ValueError: If initialization fails
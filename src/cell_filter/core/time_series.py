@@ -0,0 +1,88 @@
+"""
+Time series encoding utilities for cell-filter.
+
+Analysis results map pattern indices to the frames in which the pattern had the
+wanted number of nuclei. These frame lists are mostly long consecutive runs, so
+they are stored run-length encoded as inclusive [start, end] pairs.
+"""
+
+from typing import Any, Dict, List
+
+# Schema version of the time series JSON files written by the analyzer
+TIME_SERIES_VERSION = 2
+
+# =====================================================================
+# Run-Length Encoding
+# =====================================================================
+
+def encode_runs(frames: List[int]) -> List[List[int]]:
+    """
+    Encode frame indices as runs of consecutive frames.
+
+    Args:
+        frames (List[int]): Frame indices
+
+    Returns:
+        List[List[int]]: Inclusive [start, end] pairs in ascending order
+
+    Example:
+        >>> encode_runs([0, 1, 2, 5, 6, 9])
+        [[0, 2], [5, 6], [9, 9]]
+    """
+    runs: List[List[int]] = []
+    for frame_idx in sorted(frames):
+        if runs and frame_idx <= runs[-1][1] + 1:
+            runs[-1][1] = max(runs[-1][1], frame_idx)
+        else:
+            runs.append([frame_idx, frame_idx])
+    return runs
+
+def decode_runs(runs: List[List[int]]) -> List[int]:
+    """
+    Expand runs of consecutive frames back into frame indices.
+
+    Args:
+        runs (List[List[int]]): Inclusive [start, end] pairs
+
+    Returns:
+        List[int]: Frame indices
+    """
+    return [frame_idx for start, end in runs for frame_idx in range(start, end + 1)]
+
+# =====================================================================
+# Time Series Files
+# =====================================================================
+
+def encode_time_series(time_series: Dict[int, List[int]]) -> Dict[str, Any]:
+    """
+    Build the JSON payload for a time series.
+
+    Args:
+        time_series (Dict[int, List[int]]): Mapping of pattern indices to frame indices
+
+    Returns:
+        Dict[str, Any]: Versioned payload with run-length encoded frames
+    """
+    return {
+        "version": TIME_SERIES_VERSION,
+        "time_series_rle": {idx: encode_runs(frames) for idx, frames in time_series.items()},
+    }
+
+def decode_time_series(data: Dict[str, Any]) -> Dict[int, List[int]]:
+    """
+    Read a time series from a JSON payload of any supported version.
+
+    Args:
+        data (Dict[str, Any]): Loaded JSON payload
+
+    Returns:
+        Dict[int, List[int]]: Mapping of pattern indices to frame indices
+
+    Raises:
+        ValueError: If the payload contains no time series
+    """
+    if "time_series_rle" in data:
+        return {int(idx): decode_runs(runs) for idx, runs in data["time_series_rle"].items()}
+    if "time_series" in data:
+        return {int(idx): list(frames) for idx, frames in data["time_series"].items()}
+    raise ValueError("No time series found in data")
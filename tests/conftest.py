@@ -0,0 +1,73 @@
+"""
+Shared fakes for tests that read ND2 files.
+"""
+
+import numpy as np
+import pytest
+
+
+class FakeLazyArray:
+    """Minimal stand-in for the dask array returned by ND2File.to_dask()."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def __getitem__(self, index):
+        return FakeLazyArray(self.data[index])
+
+    def compute(self, scheduler=None):
+        return self.data
+
+
+class FakeND2File:
+    """ND2 reader serving in-memory planes; axes of size 1 are omitted as in nd2."""
+
+    planes = {}
+
+    def __init__(self, path):
+        self.data, axes = self.planes[path]
+        self.sizes = dict(zip(axes, self.data.shape))
+        self.dtype = self.data.dtype
+
+    def to_dask(self):
+        return FakeLazyArray(self.data)
+
+    def close(self):
+        pass
+
+
+def _make_patterns(speck: bool = False) -> np.ndarray:
+    """Grid of 3 x 4 hollow squares, optionally with a speck inside the first one."""
+    image = np.full((220, 300), 100, dtype=np.uint16)
+    for row in range(3):
+        for col in range(4):
+            y, x = 20 + row * 65, 20 + col * 65
+            image[y:y + 40, x:x + 40] = 3000
+            image[y + 5:y + 35, x + 5:x + 35] = 100
+    if speck:
+        image[37:43, 37:43] = 3000
+    return image
+
+
+@pytest.fixture
+def make_patterns():
+    return _make_patterns
+
+
+@pytest.fixture
+def nd2_files(monkeypatch, tmp_path):
+    """Serve in-memory patterns and cells arrays through nd2.ND2File and return their paths."""
+    nd2 = pytest.importorskip("nd2")
+
+    def _make(patterns, cells, patterns_axes=('Y', 'X'), cells_axes=('C', 'Y', 'X')):
+        patterns_path = tmp_path / "patterns.nd2"
+        cells_path = tmp_path / "cells.nd2"
+        patterns_path.touch()
+        cells_path.touch()
+        FakeND2File.planes = {
+            str(patterns_path.resolve()): (patterns, tuple(patterns_axes)),
+            str(cells_path.resolve()): (cells, tuple(cells_axes)),
+        }
+        monkeypatch.setattr(nd2, "ND2File", FakeND2File)
+        return str(patterns_path), str(cells_path)
+    return _make
@@ -0,0 +1,102 @@
+"""
+Tests for the time series analyzer.
+"""
+
+import numpy as np
+import orjson
+import pytest
+
+pytest.importorskip("nd2")
+pytest.importorskip("cellpose")
+
+from cell_filter.core import count
+from cell_filter.core.analyze import Analyzer
+from cell_filter.core.time_series import decode_time_series
+
+N_FRAMES = 10
+N_PATTERNS = 12
+WANTED = 2
+
+
+class FakeCellposeModel:
+    """Stand-in for CellposeModel that finds the same number of nuclei in every crop."""
+
+    nuclei = WANTED
+    device = "cpu"
+
+    def __init__(self, **kwargs):
+        self.calls = []
+
+    def eval(self, images, **kwargs):
+        self.calls.append(len(images))
+        masks = []
+        for image in images:
+            mask = np.zeros(image.shape, dtype=np.int32)
+            mask.flat[:self.nuclei] = np.arange(1, self.nuclei + 1)
+            masks.append(mask)
+        return masks, None, None
+
+
+@pytest.fixture
+def make_analyzer(nd2_files, make_patterns, monkeypatch, tmp_path):
+    monkeypatch.setattr(count.models, "CellposeModel", FakeCellposeModel)
+
+    def _make(n_views: int = 1, nuclei: int = WANTED, frame_batch_size: int = 4) -> Analyzer:
+        monkeypatch.setattr(FakeCellposeModel, "nuclei", nuclei)
+        patterns = np.stack([make_patterns()] * n_views)
+        cells = np.random.default_rng(0).integers(1, 4000, (N_FRAMES, n_views, 2) + patterns.shape[1:]).astype(np.uint16)
+        patterns_path, cells_path = nd2_files(patterns, cells, ('P', 'Y', 'X'), ('T', 'P', 'C', 'Y', 'X'))
+        return Analyzer(
+            patterns_path, cells_path, str(tmp_path / "analysis"), wanted=WANTED, use_gpu=False,
+            diameter=5, nuclei_channel=1, cyto_channel=0, frame_batch_size=frame_batch_size
+        )
+    return _make
+
+
+def test_frames_are_counted_in_batches(make_analyzer):
+    analyzer = make_analyzer(frame_batch_size=4)
+
+    time_series = decode_time_series(analyzer.analyze_time_series(0))
+
+    assert analyzer.counter.model.calls == [4 * N_PATTERNS, 4 * N_PATTERNS, 2 * N_PATTERNS]
+    assert time_series == {pattern_idx: list(range(N_FRAMES)) for pattern_idx in range(N_PATTERNS)}
+
+
+def test_analysis_stops_once_all_patterns_are_dropped(make_analyzer):
+    analyzer = make_analyzer(nuclei=0, frame_batch_size=4)
+
+    time_series = decode_time_series(analyzer.analyze_time_series(0))
+
+    assert analyzer.counter.model.calls == [4 * N_PATTERNS]
+    assert analyzer.patterns.dropped_zero == list(range(N_PATTERNS))
+    assert time_series == {}
+
+
+def test_process_views_appends_to_tracking_file(make_analyzer, tmp_path):
+    analyzer = make_analyzer(n_views=2)
+
+    analyzer.process_views(0, 2)
+
+    output_path = tmp_path / "analysis"
+    tracking_lines = (output_path / Analyzer.TRACKING_FILE).read_bytes().splitlines()
+    assert [orjson.loads(line) for line in tracking_lines] == [0, 1]
+    assert (output_path / "time_series_000.json").is_file()
+    assert (output_path / "time_series_001.json").is_file()
+    assert analyzer._load_processed_views() == {0, 1}
+
+
+def test_process_views_skips_views_from_both_tracking_files(make_analyzer, tmp_path):
+    output_path = tmp_path / "analysis"
+    output_path.mkdir()
+    (output_path / "processed_views.json").write_bytes(orjson.dumps([0]))
+    (output_path / Analyzer.TRACKING_FILE).write_bytes(b"1\n")
+    analyzer = make_analyzer(n_views=3)
+
+    assert analyzer._load_processed_views() == {0, 1}
+    analyzer.process_views(0, 3)
+
+    assert analyzer.counter.model.calls
+    assert not (output_path / "time_series_000.json").exists()
+    assert not (output_path / "time_series_001.json").exists()
+    assert (output_path / "time_series_002.json").is_file()
+    assert (output_path / Analyzer.TRACKING_FILE).read_bytes() == b"1\n2\n"
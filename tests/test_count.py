@@ -0,0 +1,64 @@
+"""
+Tests for the Cellpose-based counter.
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cellpose")
+
+from cell_filter.core import count
+
+
+class FakeCellposeModel:
+    """Stand-in for CellposeModel that labels one object per image plus its index."""
+
+    def __init__(self, **kwargs):
+        self.calls = []
+
+    def eval(self, images, **kwargs):
+        self.calls.append((images, kwargs))
+        masks = []
+        for image_idx, image in enumerate(images):
+            mask = np.zeros(image.shape, dtype=np.int32)
+            for label in range(1, image_idx + 2):
+                mask[0, label - 1] = label
+            masks.append(mask)
+        return masks, None, None
+
+
+@pytest.fixture
+def counter(monkeypatch):
+    monkeypatch.setattr(count.models, "CellposeModel", FakeCellposeModel)
+    return count.CellposeCounter(use_gpu=False)
+
+
+@pytest.mark.parametrize("n_images", [1, 2, 3])
+def test_count_nuclei_stack_round_trips_per_image(counter, n_images):
+    images = np.zeros((n_images, 12, 10), dtype=np.uint8)
+
+    counts = counter.count_nuclei(images, diameter=5)
+
+    assert counts == list(range(1, n_images + 1))
+    passed, kwargs = counter.model.calls[-1]
+    assert isinstance(passed, list)
+    assert [image.shape for image in passed] == [(12, 10)] * n_images
+    assert "z_axis" not in kwargs
+
+
+def test_count_nuclei_keeps_crop_shapes(counter):
+    images = [np.zeros((12, 10), dtype=np.uint8), np.zeros((8, 15), dtype=np.uint8)]
+
+    counts = counter.count_nuclei(images, diameter=5)
+
+    assert counts == [1, 2]
+    passed, _ = counter.model.calls[-1]
+    assert [image.shape for image in passed] == [(12, 10), (8, 15)]
+
+
+def test_count_nuclei_single_image(counter):
+    assert counter.count_nuclei(np.zeros((12, 10), dtype=np.uint8), diameter=5) == [1]
+
+
+def test_count_nuclei_empty(counter):
+    assert counter.count_nuclei([], diameter=5) == []
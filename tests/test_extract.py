@@ -0,0 +1,113 @@
+"""
+Tests for sequence extraction from analysis results.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+pytest.importorskip("nd2")
+
+from cell_filter.core.extract import Extractor
+from cell_filter.core.generate import CellGenerator
+from cell_filter.core.time_series import encode_time_series
+
+N_FRAMES = 16
+NUCLEI_CHANNEL = 1
+CYTO_CHANNEL = 0
+
+
+@pytest.fixture
+def cells(make_patterns):
+    shape = (N_FRAMES, 2) + make_patterns().shape
+    return np.random.default_rng(0).integers(0, 4000, shape).astype(np.uint16)
+
+
+@pytest.fixture
+def time_series_dir(tmp_path):
+    # Pattern 0 is valid for frames 2-13, i.e. 0-15 with head and tail frames;
+    # pattern 5 is too short to be extracted
+    time_series_dir = tmp_path / "analysis"
+    time_series_dir.mkdir()
+    with open(time_series_dir / "time_series_000.json", 'w') as f:
+        json.dump(encode_time_series({0: list(range(2, 14)), 5: [1, 2]}), f)
+    return time_series_dir
+
+
+@pytest.fixture
+def extractor(nd2_files, make_patterns, cells, tmp_path):
+    patterns_path, cells_path = nd2_files(make_patterns(), cells, cells_axes=('T', 'C', 'Y', 'X'))
+    return Extractor(patterns_path, cells_path, str(tmp_path / "out"), NUCLEI_CHANNEL, CYTO_CHANNEL)
+
+
+@pytest.fixture
+def outputs(tmp_path):
+    prefix = tmp_path / "out" / "extraction" / "view_000_pattern_000_000"
+    return prefix.with_suffix(".npy"), prefix.with_suffix(".json")
+
+
+def count_slab_reads(extractor, monkeypatch):
+    calls = []
+    read_slab = extractor.generator.read_slab
+    monkeypatch.setattr(extractor.generator, "read_slab", lambda *args: calls.append(args) or read_slab(*args))
+    return calls
+
+
+@pytest.mark.parametrize("frame_stride, end_frame", [(1, 15), (2, 14), (4, 12)])
+def test_extract_frame_stride(extractor, cells, time_series_dir, outputs, frame_stride, end_frame):
+    extractor.extract(time_series_dir, min_frames=5, frame_stride=frame_stride)
+
+    frame_path, json_path = outputs
+    assert sorted(path.name for path in frame_path.parent.iterdir()) == [json_path.name, frame_path.name]
+    with open(json_path) as f:
+        metadata = json.load(f)
+    frames = list(range(0, end_frame + 1, frame_stride))
+    assert metadata["start_frame"] == 0
+    assert metadata["end_frame"] == end_frame
+    assert metadata["frame_stride"] == frame_stride
+    assert metadata["n_frames"] == len(frames)
+
+    stack = np.load(frame_path)
+    rows, cols = extractor.generator.region_slices[0]
+    pattern = extractor.generator.extract_pattern(0)
+    assert stack.shape == (len(frames), 3) + pattern.shape
+    np.testing.assert_array_equal(stack[:, 0], np.broadcast_to(pattern, stack[:, 0].shape))
+    np.testing.assert_array_equal(stack[:, 1], cells[frames, NUCLEI_CHANNEL, rows, cols])
+    np.testing.assert_array_equal(stack[:, 2], cells[frames, CYTO_CHANNEL, rows, cols])
+
+
+def test_rerun_skips_extracted_sequences(extractor, time_series_dir, outputs, monkeypatch):
+    extractor.extract(time_series_dir, min_frames=5)
+    frame_path, _ = outputs
+    mtime = frame_path.stat().st_mtime_ns
+
+    calls = count_slab_reads(extractor, monkeypatch)
+    extractor.extract(time_series_dir, min_frames=5)
+
+    assert not calls
+    assert frame_path.stat().st_mtime_ns == mtime
+
+
+@pytest.mark.parametrize("change", ["frame_stride", "overwrite", "detection"])
+def test_rerun_extracts_stale_sequences(extractor, time_series_dir, outputs, monkeypatch, change):
+    extractor.extract(time_series_dir, min_frames=5)
+    _, json_path = outputs
+    with open(json_path) as f:
+        signature = json.load(f)["patterns_signature"]
+
+    kwargs = {}
+    if change == "frame_stride":
+        kwargs["frame_stride"] = 2
+    elif change == "overwrite":
+        kwargs["overwrite"] = True
+    else:
+        monkeypatch.setattr(CellGenerator, "DETECTION_VERSION", CellGenerator.DETECTION_VERSION + 1)
+    calls = count_slab_reads(extractor, monkeypatch)
+    extractor.extract(time_series_dir, min_frames=5, **kwargs)
+
+    assert calls
+    with open(json_path) as f:
+        metadata = json.load(f)
+    assert metadata["frame_stride"] == kwargs.get("frame_stride", 1)
+    assert (metadata["patterns_signature"] == signature) == (change != "detection")
@@ -0,0 +1,82 @@
+"""
+Tests for pattern detection in the cell generator.
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("nd2")
+
+from cell_filter.core.generate import CellGenerator, CellGeneratorParameters
+
+
+@pytest.fixture
+def make_generator(nd2_files):
+    def _make(patterns: np.ndarray) -> CellGenerator:
+        cells = np.zeros((2,) + patterns.shape, dtype=np.uint16)
+        patterns_path, cells_path = nd2_files(patterns, cells)
+        return CellGenerator(patterns_path, cells_path, CellGeneratorParameters())
+    return _make
+
+
+def test_speck_inside_pattern_is_not_a_component(make_generator, make_patterns):
+    generator = make_generator(make_patterns(speck=True))
+    generator.load_patterns()
+
+    patterns_norm = generator._normalize_pct(generator.patterns, 10, 90)
+    stats, _ = generator._find_components(patterns_norm)
+
+    assert len(stats) == 12
+
+
+def test_component_area_includes_filled_holes(make_generator, make_patterns):
+    generator = make_generator(make_patterns(speck=False))
+    generator.load_patterns()
+
+    patterns_norm = generator._normalize_pct(generator.patterns, 10, 90)
+    stats, _ = generator._find_components(patterns_norm)
+
+    widths, heights, areas = stats[:, 2], stats[:, 3], stats[:, 4]
+    assert np.all(areas > 0.9 * widths * heights)
+
+
+def test_speck_does_not_change_detected_patterns(make_generator, make_patterns):
+    plain = make_generator(make_patterns(speck=False))
+    plain.load_patterns()
+    plain.process_patterns()
+
+    specked = make_generator(make_patterns(speck=True))
+    specked.load_patterns()
+    specked.process_patterns()
+
+    assert specked.n_patterns == 12
+    np.testing.assert_array_equal(specked.bounding_boxes, plain.bounding_boxes)
+    np.testing.assert_array_equal(specked.centers, plain.centers)
+
+
+def test_patterns_cache_rejected_after_detection_change(make_generator, make_patterns, monkeypatch, tmp_path):
+    generator = make_generator(make_patterns(speck=False))
+    generator.load_patterns()
+    generator.process_patterns()
+    cache_path = tmp_path / ".cache" / "view_000.npz"
+    generator.save_patterns_cache(cache_path)
+
+    assert generator.load_patterns_cache(cache_path)
+    assert generator.bounding_boxes.shape == (12, 4)
+
+    monkeypatch.setattr(CellGenerator, "DETECTION_VERSION", CellGenerator.DETECTION_VERSION + 1)
+    assert not generator.load_patterns_cache(cache_path)
+
+
+@pytest.mark.parametrize("normalize", [False, True])
+def test_extract_all_nuclei_matches_single_extraction(make_generator, make_patterns, normalize):
+    generator = make_generator(make_patterns(speck=False))
+    generator.load_patterns()
+    generator.process_patterns()
+    generator.frame_nuclei = np.random.default_rng(0).integers(0, 4000, generator.patterns.shape).astype(np.uint16)
+
+    regions = generator.extract_all_nuclei(normalize=normalize)
+
+    assert len(regions) == generator.n_patterns
+    for pattern_idx, region in enumerate(regions):
+        np.testing.assert_array_equal(region, generator.extract_nuclei(pattern_idx, normalize=normalize))
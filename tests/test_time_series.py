@@ -0,0 +1,47 @@
+"""
+Tests for the run-length encoded time series files.
+"""
+
+import json
+
+import pytest
+
+from cell_filter.core.time_series import (
+    TIME_SERIES_VERSION,
+    decode_runs,
+    decode_time_series,
+    encode_runs,
+    encode_time_series,
+)
+
+
+@pytest.mark.parametrize("frames, runs", [
+    ([], []),
+    ([4], [[4, 4]]),
+    ([0, 1, 2, 5, 6, 9], [[0, 2], [5, 6], [9, 9]]),
+    ([6, 5, 0, 2, 1, 9], [[0, 2], [5, 6], [9, 9]]),
+    ([3, 3, 4], [[3, 4]]),
+])
+def test_encode_runs(frames, runs):
+    assert encode_runs(frames) == runs
+    assert decode_runs(runs) == sorted(set(frames))
+
+
+def test_time_series_round_trips_through_json():
+    time_series = {0: [0, 1, 2, 7, 8], 3: [], 11: list(range(5, 40))}
+
+    data = json.loads(json.dumps(encode_time_series(time_series)))
+
+    assert data["version"] == TIME_SERIES_VERSION
+    assert decode_time_series(data) == time_series
+
+
+def test_decode_legacy_time_series():
+    data = {"time_series": {"0": [0, 1, 2, 7], "5": [3]}}
+
+    assert decode_time_series(data) == {0: [0, 1, 2, 7], 5: [3]}
+
+
+def test_decode_without_time_series_raises():
+    with pytest.raises(ValueError):
+        decode_time_series({"version": TIME_SERIES_VERSION})